@@ -9,20 +9,59 @@ Usage:
     app.py config.yaml --validate         # Validate only
     app.py config.yaml --parse            # Parse + validate (explicit)
     app.py config.yaml --output config.json
+    app.py config.yaml --pins             # List used pins only (fast scan)
 """
 
 import sys
+import hashlib
+import importlib.util
 from pathlib import Path
 import click
 from rich.console import Console
-from rich.panel import Panel
 
-from parser import YAMLConfigParser, ConfigurationError
-from validator import ConfigValidator
+from common import read_cached, store_cached
+
+def _import_parser():
+    """Import the Cython build of parser.py if it was built from the current source
+
+    install.py stamps the build with a hash of parser.py; a missing or stale
+    build falls back to parser.py, so local edits are never shadowed.
+    """
+    source = Path(__file__).with_name("parser.py")
+    try:
+        import _parser_native
+        if getattr(_parser_native, "SOURCE_HASH", None) == hashlib.sha256(source.read_bytes()).hexdigest():
+            # Compiled example modules import their classes from "parser"
+            sys.modules.setdefault("parser", _parser_native)
+            return _parser_native
+    except (ImportError, OSError):
+        pass
+    import parser
+    return parser
+
+_parser = _import_parser()
+YAMLConfigParser, ConfigurationError, scan_pins = _parser.YAMLConfigParser, _parser.ConfigurationError, _parser.scan_pins
 
 # Console for rich output
 console = Console()
 
+# Header panel, pre-rendered as Panel.fit(border_style="blue") would draw it
+_BANNER_TITLE = "Embedded Peripheral Configuration Parser"
+_BANNER_SUBTITLE = "Clean YAML-based configuration parser for embedded peripherals"
+_BANNER_INNER = max(len(_BANNER_TITLE), len(_BANNER_SUBTITLE)) + 2
+_BANNER_PLAIN = (
+    f"╭{'─' * _BANNER_INNER}╮\n"
+    f"│ {_BANNER_TITLE:<{_BANNER_INNER - 2}} │\n"
+    f"│ {_BANNER_SUBTITLE:<{_BANNER_INNER - 2}} │\n"
+    f"╰{'─' * _BANNER_INNER}╯\n"
+)
+_BANNER_ANSI = (
+    f"\x1b[34m╭{'─' * _BANNER_INNER}╮\x1b[0m\n"
+    f"\x1b[34m│\x1b[0m \x1b[1;34m{_BANNER_TITLE}\x1b[0m{' ' * (_BANNER_INNER - 2 - len(_BANNER_TITLE))} \x1b[34m│\x1b[0m\n"
+    f"\x1b[34m│\x1b[0m \x1b[2m{_BANNER_SUBTITLE}\x1b[0m{' ' * (_BANNER_INNER - 2 - len(_BANNER_SUBTITLE))} \x1b[34m│\x1b[0m\n"
+    f"\x1b[34m╰{'─' * _BANNER_INNER}╯\x1b[0m\n"
+)
+
 @click.command()
 @click.argument('config_file', type=click.Path(exists=True))
 @click.option('--validate', is_flag=True, help='Validate configuration only')
@@ -30,7 +69,11 @@ console = Console()
 @click.option('--output', '-o', type=click.Path(), help='Output JSON file path')
 @click.option('--summary', '-s', is_flag=True, help='Show configuration summary')
 @click.option('--verbose', is_flag=True, help='Verbose output')
-def main(config_file: str, validate: bool, parse: bool, output: str, summary: bool, verbose: bool):
+@click.option('--no-cache', is_flag=True, help='Ignore cached parse and validation results')
+@click.option('--pins', is_flag=True, help='List used pins only, skipping parsing and validation')
+@click.option('--enabled-only', is_flag=True, help='Skip disabled peripherals entirely (faster summaries)')
+def main(config_file: str, validate: bool, parse: bool, output: str, summary: bool, verbose: bool, no_cache: bool,
+         pins: bool, enabled_only: bool):
     """
     Parse YAML configuration file for embedded peripheral setup.
     
@@ -42,32 +85,47 @@ def main(config_file: str, validate: bool, parse: bool, output: str, summary: bo
         app.py .\examples\advanced_board.yaml --validate           # Validate only
         app.py .\examples\advanced_board.yaml --output config.json # Export to JSON
         app.py .\examples\advanced_board.yaml --verbose            # Verbose output with pin usage
+        app.py .\examples\advanced_board.yaml --pins               # Pin usage from a quick scan
+        app.py .\examples\advanced_board.yaml -s --enabled-only    # Summary of enabled peripherals only
     """
     
     # Print header
-    console.print(Panel.fit(
-        "[bold blue]Embedded Peripheral Configuration Parser[/bold blue]\n"
-        "[dim]Clean YAML-based configuration parser for embedded peripherals[/dim]",
-        border_style="blue"
-    ))
+    print_banner()
     
     console.print(f"\n[yellow]📁 Loading configuration:[/yellow] [cyan]{config_file}[/cyan]")
     
     try:
-        # Initialize parser and validator
+        # Pin listing only needs the pin scalars, not the full config objects
+        if pins:
+            show_pin_usage_summary(scan_pins(config_file))
+            return
+
         parser = YAMLConfigParser()
-        validator = ConfigValidator()
         
-        # Load configuration
-        config = parser.load_config(config_file)
+        # Reuse the previous result when the config, schemas and code are unchanged
+        cache_key = None if no_cache else validation_cache_key(config_file, enabled_only)
+        cached = read_cached(cache_key) if cache_key else None
+
+        if cached:
+            config, validation_result = cached
+            parser.config = config
+        else:
+            # Load and validate configuration; the validator pulls in
+            # jsonschema, so it is only imported when there is work to do
+            from validator import ConfigValidator
+            validator = ConfigValidator()
+            config = parser.load_config(config_file, enabled_only=enabled_only)
+            validation_result = validator.validate(config)
+            if cache_key:
+                store_cached(cache_key, (config, validation_result))
         console.print("[green]✓ Configuration loaded successfully[/green]")
         
         # Determine operation mode
         if validate:
-            validate_only(config, validator, verbose)
+            validate_only(validation_result, verbose)
         else:
             # As default parse and validate
-            parse_and_display(config, parser, validator, output, summary, verbose)
+            parse_and_display(config, parser, validation_result, output, summary, verbose)
     
     except ConfigurationError as e:
         console.print(f"\n[red]❌ Configuration Error:[/red] {e}")
@@ -82,62 +140,90 @@ def main(config_file: str, validate: bool, parse: bool, output: str, summary: bo
             console.print(f"\n[red]Traceback:[/red]\n{traceback.format_exc()}")
         sys.exit(1)
 
-def validate_only(config, validator, verbose: bool):
-    """Validate configuration only and show results"""
+def print_banner():
+    """Print the header panel, using rich's layout only when the baked copy won't fit"""
+    if console.legacy_windows or console.width < _BANNER_INNER + 2 or not console.encoding.startswith("utf"):
+        from rich.panel import Panel
+        console.print(Panel.fit(
+            f"[bold blue]{_BANNER_TITLE}[/bold blue]\n"
+            f"[dim]{_BANNER_SUBTITLE}[/dim]",
+            border_style="blue"
+        ))
+        return
+
+    color = console.color_system is not None and not console.no_color
+    console.file.write(_BANNER_ANSI if color else _BANNER_PLAIN)
+
+def validation_cache_key(config_file: str, enabled_only: bool = False, schema_dir: Path = Path("schemas")) -> str:
+    """Hash the config file together with the schemas and modules validation depends on"""
+    digest = hashlib.sha256(Path(config_file).read_bytes())
+    digest.update(b"enabled-only" if enabled_only else b"full")
+
+    # parser.py itself, a native build is only used while it matches the source
+    dependencies = [Path(__file__).with_name("parser.py"), Path(importlib.util.find_spec("validator").origin)]
+    dependencies.extend(sorted(schema_dir.rglob("*.json")))
+    for dependency in dependencies:
+        stat = dependency.stat()
+        digest.update(f"{dependency}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+
+    return digest.hexdigest()
+
+def validate_only(validation_result, verbose: bool):
+    """Show validation results only"""
     console.print("\n[yellow]🔍 Validating configuration...[/yellow]")
     
-    # Run validation
-    validation_result = validator.validate(config)
+    # The message lists are properties that rebuild on each access, so fetch once
+    errors = validation_result.errors
+    warnings = validation_result.warnings
     
     # Display results
-    if validation_result.has_errors():
+    if errors:
         console.print("\n[red]❌ Validation Errors:[/red]")
-        for error in validation_result.errors:
-            console.print(f"  [red]•[/red] {error}")
+        console.print("\n".join(f"  [red]•[/red] {error}" for error in errors))
         
-        console.print(f"\n[red]❌ Validation failed with {len(validation_result.errors)} error(s)[/red]")
+        console.print(f"\n[red]❌ Validation failed with {len(errors)} error(s)[/red]")
         console.print("[red]🛑 Fix the errors above and try again[/red]")
         sys.exit(1)
     
-    if validation_result.has_warnings():
+    if warnings:
         console.print("\n[yellow]⚠️  Validation Warnings:[/yellow]")
-        for warning in validation_result.warnings:
-            console.print(f"  [yellow]•[/yellow] {warning}")
+        console.print("\n".join(f"  [yellow]•[/yellow] {warning}" for warning in warnings))
         console.print("[yellow]✓ Validation passed with warnings[/yellow]")
     else:
         console.print("[green]✓ All validation checks passed[/green]")
     
     # Show validation details in verbose mode
-    if verbose and validation_result.info_messages:
+    info_messages = validation_result.info_messages if verbose else None
+    if info_messages:
         console.print("\n[blue]ℹ️  Validation Info:[/blue]")
-        for info in validation_result.info_messages:
-            console.print(f"  [blue]•[/blue] {info}")
+        console.print("\n".join(f"  [blue]•[/blue] {info}" for info in info_messages))
     
     console.print("\n[green]🎉 Validation completed successfully![/green]")
 
-def parse_and_display(config, parser, validator, output: str, summary: bool, verbose: bool):
-    """Parse, validate, and display configuration"""
+def parse_and_display(config, parser, validation_result, output: str, summary: bool, verbose: bool):
+    """Show validation results and display configuration"""
     
-    # Always validate first
+    # Always report validation first
     console.print("\n[yellow]🔍 Validating configuration...[/yellow]")
-    validation_result = validator.validate(config)
+
+    # The message lists are properties that rebuild on each access, so fetch once
+    errors = validation_result.errors
+    warnings = validation_result.warnings
     
     # Check for validation errors
-    if validation_result.has_errors():
+    if errors:
         console.print("\n[red]❌ Validation Errors:[/red]")
-        for error in validation_result.errors:
-            console.print(f"  [red]•[/red] {error}")
+        console.print("\n".join(f"  [red]•[/red] {error}" for error in errors))
         
-        console.print(f"\n[red]❌ Validation failed with {len(validation_result.errors)} error(s)[/red]")
+        console.print(f"\n[red]❌ Validation failed with {len(errors)} error(s)[/red]")
         console.print("[red]🛑 Stopping execution due to validation errors[/red]")
         console.print("[dim]Fix the errors above and try again[/dim]")
         sys.exit(1)
     
     # Show validation warnings
-    if validation_result.has_warnings():
+    if warnings:
         console.print("\n[yellow]⚠️  Validation Warnings:[/yellow]")
-        for warning in validation_result.warnings:
-            console.print(f"  [yellow]•[/yellow] {warning}")
+        console.print("\n".join(f"  [yellow]•[/yellow] {warning}" for warning in warnings))
         console.print("[yellow]✓ Validation passed with warnings[/yellow]")
     else:
         console.print("[green]✓ All validation checks passed[/green]")
@@ -150,7 +236,7 @@ def parse_and_display(config, parser, validator, output: str, summary: bool, ver
     
     # Verbose pin usage summary
     if verbose:
-        show_pin_usage_summary(config)
+        show_pin_usage_summary(config.get_used_pins_set())
     
     # Export to JSON if requested
     if output:
@@ -158,42 +244,18 @@ def parse_and_display(config, parser, validator, output: str, summary: bool, ver
     
     # Default JSON output if no other output specified
     if not summary and not verbose and not output:
-        import json
-        from dataclasses import asdict
-        config_dict = asdict(config)
-
-        # Cleanup nulls
-        cleaned_config = remove_nulls(config_dict)
-
-        print(json.dumps(cleaned_config, indent=2))
+        # Escaped like the stdlib default, so any terminal encoding can show it
+        config.dump_json(sys.stdout, clean=True, ensure_ascii=True)
+        sys.stdout.write("\n")
     
     console.print("\n[green]🎉 Processing completed successfully![/green]")
 
-def remove_nulls(obj):
-    """Null cleaner"""
-
-    if isinstance(obj, dict):
-        result = {}
-        for k, v in obj.items():
-            cleaned_v = remove_nulls(v)
-            # Add if not null, empty string or empty list
-            if cleaned_v is not None and cleaned_v != "" and cleaned_v != []:
-                result[k] = cleaned_v
-        return result
-    elif isinstance(obj, list):
-        return [remove_nulls(item) for item in obj if item is not None]
-    else:
-        return obj
-
-def show_pin_usage_summary(config):
+def show_pin_usage_summary(used_pins):
     """Show detailed pin usage summary"""
-    used_pins = set(config.get_all_used_pins())
-    
     console.print(f"\n[bold cyan]📌 Pin Usage Summary:[/bold cyan]")
     console.print(f"Total pins used: [yellow]{len(used_pins)}[/yellow]")
     if used_pins:
-        sorted_pins = sorted(used_pins)
-        console.print(f"Pins: [cyan]{', '.join(sorted_pins)}[/cyan]")
+        console.print(f"Pins: [cyan]{', '.join(sorted(used_pins))}[/cyan]")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
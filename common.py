@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Shared Helpers
+Interpreter and library feature checks plus the on-disk result cache,
+used by parser.py, validator.py, app.py and yaml_parser.py
+"""
+
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Any
+
+# Prefer the libyaml-backed loader, fall back to the pure Python one
+try:
+    from yaml import CSafeLoader as Loader
+except ImportError:
+    from yaml import SafeLoader as Loader
+
+# Optional faster JSON encoder and decoder, stdlib json is used when it is missing
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    orjson = None
+    json_loads = json.loads
+
+# Slotted dataclasses need Python 3.10+, older interpreters keep __dict__ storage
+SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# On-disk cache of pickled results, keyed by content hash and bounded to the
+# most recently used entries
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "embedded-config-parser"
+CACHE_MAX_ENTRIES = 64
+
+def read_cached(key: str) -> Any:
+    """Load a cached result, None on miss; a hit is touched for LRU eviction"""
+    path = CACHE_DIR / f"{key}.pkl"
+    try:
+        with open(path, 'rb') as f:
+            data = pickle.load(f)
+        os.utime(path)
+        return data
+    except Exception:
+        # Missing, truncated or written by an incompatible version
+        return None
+
+def store_cached(key: str, data: Any) -> None:
+    """Store a result and evict the least recently used entries, ignoring unwritable cache dirs"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_DIR / f"{key}.pkl", 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        entries = sorted(CACHE_DIR.glob("*.pkl"), key=lambda entry: entry.stat().st_mtime_ns)
+        for entry in entries[:-CACHE_MAX_ENTRIES]:
+            entry.unlink()
+    except OSError:
+        pass
@@ -5,9 +5,13 @@ This script sets up the development environment and installs dependencies.
 """
 
 import sys
+import hashlib
+import shutil
 import subprocess
 import platform
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 
 def run_command(command, description, ignore_errors=False):
     """Run a command and handle errors"""
@@ -98,6 +102,12 @@ def install_python_dependencies():
     
     return True
 
+def check_import(python_cmd, module):
+    """Import a module with the venv interpreter, return (success, stderr)"""
+    result = subprocess.run(f'{python_cmd} -c "import {module}"', shell=True,
+                            capture_output=True, text=True)
+    return result.returncode == 0, result.stderr.strip()
+
 def test_installation():
     """Test if installation was successful"""
     print("[INFO] Testing installation...")
@@ -112,17 +122,77 @@ def test_installation():
         ("jsonschema", "JSONSchema")
     ]
     
+    # Interpreter startup dominates each check, so run them concurrently
+    with ThreadPoolExecutor(max_workers=len(test_imports)) as executor:
+        results = list(executor.map(lambda item: check_import(python_cmd, item[0]), test_imports))
+
     all_passed = True
-    for module, name in test_imports:
-        success = run_command(f'{python_cmd} -c "import {module}; print(\'{name}: OK\')"', 
-                             f"Testing {name} import", 
-                             ignore_errors=True)
-        if not success:
+    for (module, name), (success, error) in zip(test_imports, results):
+        if success:
+            print(f"[SUCCESS] {name}: OK")
+        else:
             print(f"[ERROR] {name} import failed")
+            if error:
+                print(f"[ERROR] {error}")
             all_passed = False
     
     return all_passed
 
+def precompile_examples():
+    """Pre-parse example YAML configurations into JSON caches"""
+    python_cmd = get_python_command()
+
+    if not Path("examples").exists():
+        print("[INFO] No examples directory, skipping precompilation")
+        return True
+
+    return run_command(f'{python_cmd} -c "from pathlib import Path; from parser import precompile_config; '
+                       f'[precompile_config(p) for p in sorted(Path(\'examples\').glob(\'*.yaml\'))]"',
+                       "Precompiling example configurations",
+                       ignore_errors=True)
+
+def compile_examples():
+    """Write example YAML configurations out as Python modules under examples/_compiled"""
+    python_cmd = get_python_command()
+
+    if not Path("examples").exists():
+        print("[INFO] No examples directory, skipping compilation")
+        return True
+
+    return run_command(f'{python_cmd} -c "from pathlib import Path; from parser import compile_config; '
+                       f'[compile_config(p) for p in sorted(Path(\'examples\').glob(\'*.yaml\'))]"',
+                       "Compiling example configurations",
+                       ignore_errors=True)
+
+def compile_native_extensions():
+    """Compile parser.py to a native extension when Cython is available"""
+    python_cmd = get_python_command()
+
+    # Cython is optional; the plain parser.py is used when it is missing
+    try:
+        subprocess.run(f'{python_cmd} -c "import Cython"', shell=True, check=True,
+                       capture_output=True, text=True)
+    except subprocess.CalledProcessError:
+        print("[INFO] Cython not installed, skipping native build of parser.py")
+        return False
+
+    # Built as a separate _parser_native module, stamped with the hash of the
+    # parser.py it came from; app.py only uses it while that hash still matches
+    source = Path("parser.py").read_bytes()
+    build_dir = Path("build")
+    build_dir.mkdir(exist_ok=True)
+    (build_dir / "_parser_native.py").write_bytes(
+        source + f'\nSOURCE_HASH = "{hashlib.sha256(source).hexdigest()}"\n'.encode())
+
+    if not run_command(f"{python_cmd} -m Cython.Build.Cythonize -i -3 build/_parser_native.py",
+                       "Compiling parser.py with Cython",
+                       ignore_errors=True):
+        return False
+
+    for built in chain(build_dir.glob("_parser_native.*.so"), build_dir.glob("_parser_native.*.pyd")):
+        shutil.move(str(built), built.name)
+    return True
+
 def main():
     """Main installation function"""
     print("=" * 50)
@@ -144,6 +214,13 @@ def main():
         print("\n[ERROR] Failed to install dependencies!")
         sys.exit(1)
     
+    # Optional native build of the parser
+    compile_native_extensions()
+
+    # Cache parsed example configurations
+    precompile_examples()
+    compile_examples()
+
     # Test installation
     if not test_installation():
         print("\n[WARNING] Some tests failed, but installation may still work")
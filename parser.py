@@ -1,456 +1,856 @@
-#!/usr/bin/env python3
-"""
-Configuration Models and YAML Parser
-Contains all configuration data classes and YAML parsing logic
-"""
-
-import json
-import yaml
-from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
-from dataclasses import dataclass, asdict, field
-from rich.console import Console
-from rich.table import Table
-
-# Console for rich output
-console = Console()
-
-# ============================================================================
-# CONFIGURATION MODEL CLASSES
-# ============================================================================
-
-@dataclass
-class GPIOConfig:
-    """GPIO pin configuration"""
-    pin: str
-    direction: str  # "input" or "output"
-    pull: str = "none"  # "none", "up", "down"
-    speed: str = "medium"  # "low", "medium", "high", "very-high"
-    initial_state: str = "low"  # "low", "high"
-    description: str = ""
-
-@dataclass
-class UARTConfig:
-    """UART peripheral configuration"""
-    name: str
-    enabled: bool
-    baudrate: int
-    data_bits: int = 8
-    stop_bits: int = 1
-    parity: str = "none"  # "none", "even", "odd"
-    flow_control: str = "none"  # "none", "rts-cts", "xon-xoff"
-    tx_pin: str = ""
-    rx_pin: str = ""
-    description: str = ""
-
-@dataclass
-class I2CDevice:
-    """I2C device configuration"""
-    name: str
-    address: int
-    device_type: str
-    description: str = ""
-
-@dataclass
-class I2CConfig:
-    """I2C peripheral configuration"""
-    name: str
-    enabled: bool
-    speed: int  # Hz
-    scl_pin: str
-    sda_pin: str
-    pull_up: bool = True
-    description: str = ""
-    devices: List[I2CDevice] = field(default_factory=list)
-
-@dataclass
-class TimerConfig:
-    """Timer peripheral configuration"""
-    name: str
-    enabled: bool
-    prescaler: int
-    period: int
-    mode: str = "periodic"  # "periodic", "pwm", "input-capture"
-    auto_reload: bool = True
-    channel: Optional[int] = None
-    duty_cycle: Optional[int] = None  # For PWM mode (0-100%)
-    output_pin: Optional[str] = None  # For PWM mode
-    description: str = ""
-
-@dataclass
-class SPIConfig:
-    """SPI peripheral configuration"""
-    name: str
-    enabled: bool
-    mode: int  # 0, 1, 2, 3
-    speed: int  # Hz
-    data_bits: int = 8
-    bit_order: str = "msb"  # "msb", "lsb"
-    sck_pin: str = ""
-    miso_pin: str = ""
-    mosi_pin: str = ""
-    cs_pins: List[str] = field(default_factory=list)
-    description: str = ""
-
-@dataclass
-class BoardConfig:
-    """Board configuration"""
-    name: str
-    mcu: str
-    clock_frequency: int
-    voltage: float = 3.3
-    description: str = ""
-
-@dataclass
-class EmbeddedConfig:
-    """Complete embedded system configuration"""
-    board: BoardConfig
-    gpio: List[GPIOConfig] = field(default_factory=list)
-    uart: Dict[str, UARTConfig] = field(default_factory=dict)
-    i2c: Dict[str, I2CConfig] = field(default_factory=dict)
-    timers: Dict[str, TimerConfig] = field(default_factory=dict)
-    spi: Dict[str, SPIConfig] = field(default_factory=dict)
-    
-    def get_all_used_pins(self) -> List[str]:
-        """Get all pins used in configuration"""
-        pins = []
-        
-        # GPIO pins
-        pins.extend([gpio.pin for gpio in self.gpio])
-        
-        # UART pins
-        for uart in self.uart.values():
-            if uart.enabled:
-                if uart.tx_pin:
-                    pins.append(uart.tx_pin)
-                if uart.rx_pin:
-                    pins.append(uart.rx_pin)
-        
-        # I2C pins
-        for i2c in self.i2c.values():
-            if i2c.enabled:
-                pins.extend([i2c.scl_pin, i2c.sda_pin])
-        
-        # SPI pins
-        for spi in self.spi.values():
-            if spi.enabled:
-                pins.extend([spi.sck_pin, spi.miso_pin, spi.mosi_pin])
-                pins.extend(spi.cs_pins)
-        
-        # Timer pins
-        for timer in self.timers.values():
-            if timer.enabled and timer.output_pin:
-                pins.append(timer.output_pin)
-        
-        # Remove empty strings and duplicates
-        return list(set([pin for pin in pins if pin]))
-    
-    def get_enabled_peripheral_count(self) -> Dict[str, int]:
-        """Get count of enabled peripherals by type"""
-        return {
-            "uart": len([u for u in self.uart.values() if u.enabled]),
-            "i2c": len([i for i in self.i2c.values() if i.enabled]),
-            "spi": len([s for s in self.spi.values() if s.enabled]),
-            "timers": len([t for t in self.timers.values() if t.enabled]),
-            "gpio": len(self.gpio)
-        }
-
-# ============================================================================
-# EXCEPTION CLASSES
-# ============================================================================
-
-class ConfigurationError(Exception):
-    """Custom exception for configuration errors"""
-    pass
-
-# ============================================================================
-# YAML CONFIGURATION PARSER
-# ============================================================================
-
-class YAMLConfigParser:
-    """YAML-based embedded peripheral configuration parser"""
-    
-    def __init__(self):
-        self.config: Optional[EmbeddedConfig] = None
-    
-    def load_config(self, config_file: Union[str, Path]) -> EmbeddedConfig:
-        """Load and parse YAML configuration file"""
-        try:
-            with open(config_file, 'r', encoding='utf-8') as file:
-                data = yaml.safe_load(file)
-                self.config = self._parse_config_data(data)
-                return self.config
-        except FileNotFoundError:
-            raise ConfigurationError(f"Configuration file not found: {config_file}")
-        except yaml.YAMLError as e:
-            raise ConfigurationError(f"YAML parsing error: {e}")
-        except Exception as e:
-            raise ConfigurationError(f"Error loading configuration: {e}")
-    
-    def _parse_config_data(self, data: Dict[str, Any]) -> EmbeddedConfig:
-        """Parse configuration data into structured objects"""
-        try:
-            # Parse board configuration
-            if 'board' not in data:
-                raise ConfigurationError("Board configuration is required")
-            
-            board_data = data['board']
-            board = BoardConfig(
-                name=board_data.get('name', ''),
-                mcu=board_data.get('mcu', ''),
-                clock_frequency=board_data.get('clock_frequency', 0),
-                voltage=board_data.get('voltage', 3.3),
-                description=board_data.get('description', '')
-            )
-            
-            # Parse GPIO configurations
-            gpio_configs = []
-            for gpio_data in data.get('gpio', []):
-                gpio = GPIOConfig(
-                    pin=gpio_data.get('pin', ''),
-                    direction=gpio_data.get('direction', ''),
-                    pull=gpio_data.get('pull', 'none'),
-                    speed=gpio_data.get('speed', 'medium'),
-                    initial_state=gpio_data.get('initial_state', 'low'),
-                    description=gpio_data.get('description', '')
-                )
-                gpio_configs.append(gpio)
-            
-            # Parse UART configurations
-            uart_configs = {}
-            for uart_name, uart_data in data.get('uart', {}).items():
-                uart = UARTConfig(
-                    name=uart_name,
-                    enabled=uart_data.get('enabled', False),
-                    baudrate=uart_data.get('baudrate', 115200),
-                    data_bits=uart_data.get('data_bits', 8),
-                    stop_bits=uart_data.get('stop_bits', 1),
-                    parity=uart_data.get('parity', 'none'),
-                    flow_control=uart_data.get('flow_control', 'none'),
-                    tx_pin=uart_data.get('tx_pin', ''),
-                    rx_pin=uart_data.get('rx_pin', ''),
-                    description=uart_data.get('description', '')
-                )
-                uart_configs[uart_name] = uart
-            
-            # Parse I2C configurations
-            i2c_configs = {}
-            for i2c_name, i2c_data in data.get('i2c', {}).items():
-                # Parse devices
-                devices = []
-                for device_data in i2c_data.get('devices', []):
-                    device = I2CDevice(
-                        name=device_data.get('name', ''),
-                        address=device_data.get('address', 0),
-                        device_type=device_data.get('device_type', device_data.get('type', '')),
-                        description=device_data.get('description', '')
-                    )
-                    devices.append(device)
-                
-                i2c = I2CConfig(
-                    name=i2c_name,
-                    enabled=i2c_data.get('enabled', False),
-                    speed=i2c_data.get('speed', 100000),
-                    scl_pin=i2c_data.get('scl_pin', ''),
-                    sda_pin=i2c_data.get('sda_pin', ''),
-                    pull_up=i2c_data.get('pull_up', True),
-                    description=i2c_data.get('description', ''),
-                    devices=devices
-                )
-                i2c_configs[i2c_name] = i2c
-            
-            # Parse Timer configurations
-            timer_configs = {}
-            for timer_name, timer_data in data.get('timers', {}).items():
-                timer = TimerConfig(
-                    name=timer_name,
-                    enabled=timer_data.get('enabled', False),
-                    prescaler=timer_data.get('prescaler', 1),
-                    period=timer_data.get('period', 1000),
-                    mode=timer_data.get('mode', 'periodic'),
-                    auto_reload=timer_data.get('auto_reload', True),
-                    channel=timer_data.get('channel'),
-                    duty_cycle=timer_data.get('duty_cycle'),
-                    output_pin=timer_data.get('output_pin'),
-                    description=timer_data.get('description', '')
-                )
-                timer_configs[timer_name] = timer
-            
-            # Parse SPI configurations
-            spi_configs = {}
-            for spi_name, spi_data in data.get('spi', {}).items():
-                spi = SPIConfig(
-                    name=spi_name,
-                    enabled=spi_data.get('enabled', False),
-                    mode=spi_data.get('mode', 0),
-                    speed=spi_data.get('speed', 1000000),
-                    data_bits=spi_data.get('data_bits', 8),
-                    bit_order=spi_data.get('bit_order', 'msb'),
-                    sck_pin=spi_data.get('sck_pin', ''),
-                    miso_pin=spi_data.get('miso_pin', ''),
-                    mosi_pin=spi_data.get('mosi_pin', ''),
-                    cs_pins=spi_data.get('cs_pins', []),
-                    description=spi_data.get('description', '')
-                )
-                spi_configs[spi_name] = spi
-            
-            # Create final configuration
-            return EmbeddedConfig(
-                board=board,
-                gpio=gpio_configs,
-                uart=uart_configs,
-                i2c=i2c_configs,
-                timers=timer_configs,
-                spi=spi_configs
-            )
-            
-        except Exception as e:
-            raise ConfigurationError(f"Error parsing configuration data: {e}")
-    
-    def export_to_json(self, output_file: Union[str, Path]) -> None:
-        """Export configuration to JSON file"""
-        if not self.config:
-            raise ConfigurationError("No configuration loaded")
-        
-        # Convert to dictionary
-        config_dict = asdict(self.config)
-        
-        # Save to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(config_dict, f, indent=2, ensure_ascii=False)
-        
-        console.print(f"[green]Configuration exported to: {output_file}[/green]")
-    
-    def generate_summary_report(self) -> None:
-        """Generate a comprehensive summary report"""
-        if not self.config:
-            console.print("[red]No configuration loaded[/red]")
-            return
-        
-        # Board information
-        board_table = Table(title="📋 Board Configuration", show_header=False)
-        board_table.add_column("Property", style="cyan")
-        board_table.add_column("Value", style="yellow")
-        
-        board_table.add_row("Name", self.config.board.name)
-        board_table.add_row("MCU", self.config.board.mcu)
-        board_table.add_row("Clock", f"{self.config.board.clock_frequency:,} Hz")
-        board_table.add_row("Voltage", f"{self.config.board.voltage}V")
-        if self.config.board.description:
-            board_table.add_row("Description", self.config.board.description)
-        
-        console.print(board_table)
-        
-        # GPIO summary
-        if self.config.gpio:
-            gpio_table = Table(title=f"🔌 GPIO Configuration ({len(self.config.gpio)} pins)")
-            gpio_table.add_column("Pin", style="cyan")
-            gpio_table.add_column("Direction", style="green")
-            gpio_table.add_column("Pull", style="blue")
-            gpio_table.add_column("Speed", style="magenta")
-            gpio_table.add_column("Description", style="yellow")
-            
-            for gpio in self.config.gpio:
-                gpio_table.add_row(
-                    gpio.pin,
-                    gpio.direction,
-                    gpio.pull,
-                    gpio.speed,
-                    gpio.description
-                )
-            console.print(gpio_table)
-        
-        # UART summary
-        enabled_uart = [(name, uart) for name, uart in self.config.uart.items() if uart.enabled]
-        if enabled_uart:
-            uart_table = Table(title=f"📡 UART Configuration ({len(enabled_uart)} enabled)")
-            uart_table.add_column("Interface", style="cyan")
-            uart_table.add_column("Baudrate", style="green")
-            uart_table.add_column("TX Pin", style="blue")
-            uart_table.add_column("RX Pin", style="blue")
-            uart_table.add_column("Description", style="yellow")
-            
-            for name, uart in enabled_uart:
-                uart_table.add_row(
-                    name,
-                    f"{uart.baudrate:,}",
-                    uart.tx_pin,
-                    uart.rx_pin,
-                    uart.description
-                )
-            console.print(uart_table)
-        
-        # I2C summary
-        enabled_i2c = [(name, i2c) for name, i2c in self.config.i2c.items() if i2c.enabled]
-        if enabled_i2c:
-            i2c_table = Table(title=f"🔗 I2C Configuration ({len(enabled_i2c)} buses)")
-            i2c_table.add_column("Bus", style="cyan")
-            i2c_table.add_column("Speed", style="green")
-            i2c_table.add_column("SCL Pin", style="blue")
-            i2c_table.add_column("SDA Pin", style="blue")
-            i2c_table.add_column("Devices", style="magenta")
-            i2c_table.add_column("Description", style="yellow")
-            
-            for name, i2c in enabled_i2c:
-                device_count = len(i2c.devices)
-                device_list = ", ".join([f"{d.name}@0x{d.address:02X}" for d in i2c.devices[:2]])
-                if device_count > 2:
-                    device_list += f" (+{device_count-2} more)"
-                
-                i2c_table.add_row(
-                    name,
-                    f"{i2c.speed:,} Hz",
-                    i2c.scl_pin,
-                    i2c.sda_pin,
-                    device_list,
-                    i2c.description
-                )
-            console.print(i2c_table)
-        
-        # Timer summary
-        enabled_timers = [(name, timer) for name, timer in self.config.timers.items() if timer.enabled]
-        if enabled_timers:
-            timer_table = Table(title=f"⏱️  Timer Configuration ({len(enabled_timers)} enabled)")
-            timer_table.add_column("Timer", style="cyan")
-            timer_table.add_column("Mode", style="green")
-            timer_table.add_column("Prescaler", style="blue")
-            timer_table.add_column("Period", style="magenta")
-            timer_table.add_column("Output", style="yellow")
-            
-            for name, timer in enabled_timers:
-                output_info = ""
-                if timer.mode == "pwm" and timer.output_pin:
-                    output_info = f"{timer.output_pin} ({timer.duty_cycle}%)"
-                
-                timer_table.add_row(
-                    name,
-                    timer.mode,
-                    str(timer.prescaler),
-                    str(timer.period),
-                    output_info
-                )
-            console.print(timer_table)
-        
-        # SPI summary
-        enabled_spi = [(name, spi) for name, spi in self.config.spi.items() if spi.enabled]
-        if enabled_spi:
-            spi_table = Table(title=f"🔄 SPI Configuration ({len(enabled_spi)} enabled)")
-            spi_table.add_column("Interface", style="cyan")
-            spi_table.add_column("Mode", style="green")
-            spi_table.add_column("Speed", style="blue")
-            spi_table.add_column("Pins", style="magenta")
-            spi_table.add_column("Description", style="yellow")
-            
-            for name, spi in enabled_spi:
-                pins_info = f"SCK:{spi.sck_pin} MISO:{spi.miso_pin} MOSI:{spi.mosi_pin}"
-                if spi.cs_pins:
-                    pins_info += f" CS:{','.join(spi.cs_pins)}"
-                
-                spi_table.add_row(
-                    name,
-                    f"Mode {spi.mode}",
-                    f"{spi.speed:,} Hz",
-                    pins_info,
-                    spi.description
-                )
-            console.print(spi_table)
\ No newline at end of file
+#!/usr/bin/env python3
+"""
+Configuration Models and YAML Parser
+Contains all configuration data classes and YAML parsing logic
+"""
+
+import io
+import os
+import json
+import sys
+import hashlib
+import importlib.util
+from functools import cached_property, lru_cache
+from itertools import chain
+from operator import attrgetter
+import yaml
+from pathlib import Path
+from typing import Dict, List, Set, Tuple, Any, Iterator, Optional, Union, TextIO
+from dataclasses import MISSING, asdict, dataclass, field, fields, is_dataclass
+from rich.console import Console
+from rich.table import Table
+
+from common import SLOTS, Loader, json_loads, orjson
+
+# Console for rich output
+console = Console()
+
+# ============================================================================
+# CONFIGURATION MODEL CLASSES
+# ============================================================================
+
+@dataclass(frozen=True, **SLOTS)
+class GPIOConfig:
+    """GPIO pin configuration"""
+    pin: str
+    direction: str  # "input" or "output"
+    pull: str = "none"  # "none", "up", "down"
+    speed: str = "medium"  # "low", "medium", "high", "very-high"
+    initial_state: str = "low"  # "low", "high"
+    description: str = ""
+
+@dataclass(frozen=True, **SLOTS)
+class UARTConfig:
+    """UART peripheral configuration"""
+    name: str
+    enabled: bool
+    baudrate: int
+    data_bits: int = 8
+    stop_bits: int = 1
+    parity: str = "none"  # "none", "even", "odd"
+    flow_control: str = "none"  # "none", "rts-cts", "xon-xoff"
+    tx_pin: str = ""
+    rx_pin: str = ""
+    description: str = ""
+
+    def iter_labeled_pins(self) -> Iterator[Tuple[str, str]]:
+        """Yield (role, pin) for each pin of the UART"""
+        yield "TX", self.tx_pin
+        yield "RX", self.rx_pin
+
+@dataclass(frozen=True, **SLOTS)
+class I2CDevice:
+    """I2C device configuration"""
+    name: str
+    address: int
+    device_type: str
+    description: str = ""
+
+@dataclass(frozen=True, **SLOTS)
+class I2CConfig:
+    """I2C peripheral configuration"""
+    name: str
+    enabled: bool
+    speed: int  # Hz
+    scl_pin: str
+    sda_pin: str
+    pull_up: bool = True
+    description: str = ""
+    devices: List[I2CDevice] = field(default_factory=list)
+
+    def iter_labeled_pins(self) -> Iterator[Tuple[str, str]]:
+        """Yield (role, pin) for each pin of the bus"""
+        yield "SCL", self.scl_pin
+        yield "SDA", self.sda_pin
+
+@dataclass(frozen=True, **SLOTS)
+class TimerConfig:
+    """Timer peripheral configuration"""
+    name: str
+    enabled: bool
+    prescaler: int
+    period: int
+    mode: str = "periodic"  # "periodic", "pwm", "input-capture"
+    auto_reload: bool = True
+    channel: Optional[int] = None
+    duty_cycle: Optional[int] = None  # For PWM mode (0-100%)
+    output_pin: Optional[str] = None  # For PWM mode
+    description: str = ""
+
+@dataclass(frozen=True, **SLOTS)
+class SPIConfig:
+    """SPI peripheral configuration"""
+    name: str
+    enabled: bool
+    mode: int  # 0, 1, 2, 3
+    speed: int  # Hz
+    data_bits: int = 8
+    bit_order: str = "msb"  # "msb", "lsb"
+    sck_pin: str = ""
+    miso_pin: str = ""
+    mosi_pin: str = ""
+    cs_pins: List[str] = field(default_factory=list)
+    description: str = ""
+
+    def iter_labeled_pins(self) -> Iterator[Tuple[str, str]]:
+        """Yield (role, pin) for each pin of the bus, chip selects as CS0, CS1, ..."""
+        yield "SCK", self.sck_pin
+        yield "MISO", self.miso_pin
+        yield "MOSI", self.mosi_pin
+        for i, cs_pin in enumerate(self.cs_pins):
+            yield f"CS{i}", cs_pin
+
+@dataclass(frozen=True, **SLOTS)
+class BoardConfig:
+    """Board configuration"""
+    name: str
+    mcu: str
+    clock_frequency: int
+    voltage: float = 3.3
+    description: str = ""
+
+@dataclass
+class EmbeddedConfig:
+    """Complete embedded system configuration
+
+    Not slotted: the enabled-peripheral index and the schema dict are
+    cached properties, so the peripheral collections must not be mutated
+    after construction.
+    """
+    board: BoardConfig
+    gpio: List[GPIOConfig] = field(default_factory=list)
+    uart: Dict[str, UARTConfig] = field(default_factory=dict)
+    i2c: Dict[str, I2CConfig] = field(default_factory=dict)
+    timers: Dict[str, TimerConfig] = field(default_factory=dict)
+    spi: Dict[str, SPIConfig] = field(default_factory=dict)
+
+    @cached_property
+    def enabled_peripherals(self) -> Dict[str, Tuple[Tuple[str, Any], ...]]:
+        """(name, config) of each enabled UART, I2C, SPI and timer, bucketed by type, computed once"""
+        return {
+            key: tuple((name, cfg) for name, cfg in getattr(self, key).items() if cfg.enabled)
+            for key in ("uart", "i2c", "spi", "timers")
+        }
+
+    @property
+    def enabled_uart(self) -> Tuple[Tuple[str, UARTConfig], ...]:
+        """(name, config) of each enabled UART"""
+        return self.enabled_peripherals["uart"]
+
+    @property
+    def enabled_i2c(self) -> Tuple[Tuple[str, I2CConfig], ...]:
+        """(name, config) of each enabled I2C bus"""
+        return self.enabled_peripherals["i2c"]
+
+    @property
+    def enabled_spi(self) -> Tuple[Tuple[str, SPIConfig], ...]:
+        """(name, config) of each enabled SPI bus"""
+        return self.enabled_peripherals["spi"]
+
+    @property
+    def enabled_timers(self) -> Tuple[Tuple[str, TimerConfig], ...]:
+        """(name, config) of each enabled timer"""
+        return self.enabled_peripherals["timers"]
+
+    @cached_property
+    def schema_dict(self) -> Dict[str, Any]:
+        """Plain-dict form for JSON schema validation, computed once
+
+        I2C devices use the schemas' 'type' key instead of 'device_type'.
+        Treat the result as read-only, it is shared between validations.
+        """
+        data = asdict(self)
+        for i2c_config in data['i2c'].values():
+            for device in i2c_config['devices']:
+                device['type'] = device.pop('device_type')
+        return data
+
+    def get_used_pins_set(self) -> Set[str]:
+        """Get the set of pins used in configuration"""
+        enabled = self.enabled_peripherals
+        pins = chain(
+            (gpio.pin for gpio in self.gpio),
+            (pin for _, uart in enabled["uart"] for pin in (uart.tx_pin, uart.rx_pin)),
+            (pin for _, i2c in enabled["i2c"] for pin in (i2c.scl_pin, i2c.sda_pin)),
+            (pin for _, spi in enabled["spi"]
+             for pin in chain((spi.sck_pin, spi.miso_pin, spi.mosi_pin), spi.cs_pins)),
+            (timer.output_pin for _, timer in enabled["timers"])
+        )
+
+        # Remove empty pins and duplicates in one pass
+        return set(filter(None, pins))
+
+    def get_all_used_pins(self) -> List[str]:
+        """Get all pins used in configuration"""
+        return list(self.get_used_pins_set())
+
+    def get_enabled_peripheral_count(self) -> Dict[str, int]:
+        """Get count of enabled peripherals by type"""
+        enabled = self.enabled_peripherals
+        return {
+            "uart": len(enabled["uart"]),
+            "i2c": len(enabled["i2c"]),
+            "spi": len(enabled["spi"]),
+            "timers": len(enabled["timers"]),
+            "gpio": len(self.gpio)
+        }
+
+    def dump_json(self, fp: TextIO, clean: bool = False, ensure_ascii: bool = False) -> None:
+        """Write configuration as indented JSON to a text stream
+
+        With clean=True, null, empty string and empty list fields are left out.
+        With ensure_ascii=True, non-ASCII text is escaped as in json.dump.
+        """
+        write_json(self, fp, clean, ensure_ascii)
+
+# ============================================================================
+# EXCEPTION CLASSES
+# ============================================================================
+
+class ConfigurationError(Exception):
+    """Custom exception for configuration errors"""
+    pass
+
+# ============================================================================
+# JSON SERIALIZATION
+# ============================================================================
+
+def _clean_fields(o) -> Dict[str, Any]:
+    """Get dataclass fields, dropping nulls, empty strings and empty lists"""
+    result = {}
+    for f in fields(o):
+        value = getattr(o, f.name)
+        if value is not None and value != "" and value != []:
+            result[f.name] = value
+    return result
+
+def _orjson_fields_default(o):
+    """orjson fallback hook for dataclasses passed through un-serialized
+
+    orjson's native dataclass support reads __dict__, which would also emit
+    EmbeddedConfig's cached properties, so only declared fields are returned.
+    """
+    if is_dataclass(o) and not isinstance(o, type):
+        return {f.name: getattr(o, f.name) for f in fields(o)}
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+def _orjson_clean_default(o):
+    """orjson fallback hook for dataclasses passed through un-serialized"""
+    if is_dataclass(o) and not isinstance(o, type):
+        return _clean_fields(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+class DataclassJSONEncoder(json.JSONEncoder):
+    """JSON encoder that serializes config dataclasses in place, without an asdict() copy"""
+
+    def default(self, o):
+        if is_dataclass(o) and not isinstance(o, type):
+            return {f.name: getattr(o, f.name) for f in fields(o)}
+        return super().default(o)
+
+class CleanJSONEncoder(json.JSONEncoder):
+    """JSON encoder that serializes config dataclasses in place, skipping empty fields"""
+
+    def default(self, o):
+        if is_dataclass(o) and not isinstance(o, type):
+            return _clean_fields(o)
+        return super().default(o)
+
+def write_json(obj: Any, fp: TextIO, clean: bool = False, ensure_ascii: bool = False) -> None:
+    """Write a configuration object as indented JSON to a text stream
+
+    ensure_ascii=True escapes non-ASCII text, for terminals with legacy code
+    pages; orjson cannot escape, so its output is only used when pure ASCII.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+        default = _orjson_clean_default if clean else _orjson_fields_default
+        data = orjson.dumps(obj, default=default, option=option)
+        if not ensure_ascii or data.isascii():
+            fp.write(data.decode())
+            return
+
+    # json.dump writes the iterencode chunks as they are produced
+    encoder = CleanJSONEncoder if clean else DataclassJSONEncoder
+    json.dump(obj, fp, cls=encoder, indent=2, ensure_ascii=ensure_ascii)
+
+# ============================================================================
+# YAML CONFIGURATION PARSER
+# ============================================================================
+
+def _content_hash(raw: bytes) -> str:
+    """Short hash of a YAML file's raw bytes"""
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+def _load_yaml(config_file: Union[str, Path]) -> Tuple[Any, str]:
+    """Parse a YAML file, returning the data and a content version for the JSON cache
+
+    The version is "<hash> <mtime_ns> <size>". The file is stat'ed before it is
+    read, so an edit in between leaves a version that no longer matches.
+    """
+    stat = Path(config_file).stat()
+    with open(config_file, 'rb') as file:
+        version = f"{_content_hash(file.read())} {stat.st_mtime_ns} {stat.st_size}"
+        # Parse from the file handle so error marks carry the file name
+        file.seek(0)
+        return yaml.load(file, Loader=Loader), version
+
+# Generated caches (JSON sidecars, compiled modules) are only kept for the bundled examples
+_EXAMPLES_DIR = Path(__file__).resolve().parent / 'examples'
+
+def _is_example(config_file: Union[str, Path]) -> bool:
+    """Check whether a config file sits in the bundled examples directory"""
+    return Path(config_file).resolve().parent == _EXAMPLES_DIR
+
+def _json_cache_path(config_file: Union[str, Path]) -> Optional[Path]:
+    """Get the JSON cache path beside an example (examples/board.yaml -> examples/board.cache.json)
+
+    Returns None for configs outside the examples directory, so users' config
+    folders never get cache files written into them.
+    """
+    if not _is_example(config_file):
+        return None
+    config_path = Path(config_file)
+    return config_path.with_name(config_path.stem + '.cache.json')
+
+def _read_json_cache(config_file: Union[str, Path]) -> Optional[Any]:
+    """Return cached data if the cache's content version matches the YAML file
+
+    Matching mtime and size are trusted as is; otherwise (after a checkout or
+    copy, say) the YAML bytes are hashed and compared.
+    """
+    cache_path = _json_cache_path(config_file)
+    if cache_path is None:
+        return None
+    stat = Path(config_file).stat()
+    try:
+        with open(cache_path, 'rb') as f:
+            header = f.readline().split()
+            if len(header) != 5 or header[:2] != [b'#', b'content-version:']:
+                return None
+            digest, mtime_ns, size = header[2].decode(), int(header[3]), int(header[4])
+            if size != stat.st_size:
+                return None
+            if mtime_ns != stat.st_mtime_ns and digest != _content_hash(Path(config_file).read_bytes()):
+                return None
+            return json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+def _write_json_cache(config_file: Union[str, Path], data: Any, version: str) -> bool:
+    """Write parsed YAML data to the JSON cache, ignoring unwritable locations
+
+    Data that JSON does not reproduce exactly (non-string mapping keys, say)
+    is not cached, so a cache hit always parses to the same configuration.
+    """
+    cache_path = _json_cache_path(config_file)
+    if cache_path is None:
+        return False
+    try:
+        text = json.dumps(data, ensure_ascii=False)
+        if json_loads(text) != data:
+            return False
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            f.write(f"# content-version: {version}\n")
+            f.write(text)
+        return True
+    except (OSError, TypeError, ValueError):
+        return False
+
+def precompile_config(config_file: Union[str, Path]) -> bool:
+    """Parse a YAML configuration file ahead of time and write its JSON cache"""
+    try:
+        data, version = _load_yaml(config_file)
+    except (OSError, yaml.YAMLError):
+        return False
+    return _write_json_cache(config_file, data, version)
+
+def _compiled_module_path(config_file: Union[str, Path]) -> Optional[Path]:
+    """Get the compiled module path for an example (examples/board.yaml -> examples/_compiled/board.py)
+
+    Returns None for configs outside the examples directory, so a _compiled
+    folder next to an arbitrary config is never executed.
+    """
+    if not _is_example(config_file):
+        return None
+    return _EXAMPLES_DIR / '_compiled' / (Path(config_file).stem + '.py')
+
+@lru_cache(maxsize=None)
+def _parser_hash() -> str:
+    """Short hash of the parser source, so compiled modules go stale when it changes"""
+    # A native build carries the hash of the parser.py it was built from
+    source_hash = globals().get('SOURCE_HASH')
+    return (source_hash or hashlib.sha256(Path(__file__).read_bytes()).hexdigest())[:16]
+
+def _to_source(obj: Any, indent: int = 0) -> str:
+    """Render a configuration object as a Python expression that rebuilds it"""
+    pad = '    ' * (indent + 1)
+    end = '\n' + '    ' * indent
+    if is_dataclass(obj) and not isinstance(obj, type):
+        args = ''.join(f"\n{pad}{f.name}={_to_source(getattr(obj, f.name), indent + 1)}," for f in fields(obj))
+        return f"{type(obj).__name__}({args}{end})"
+    if isinstance(obj, list) and obj:
+        items = ''.join(f"\n{pad}{_to_source(item, indent + 1)}," for item in obj)
+        return f"[{items}{end}]"
+    if isinstance(obj, dict) and obj:
+        items = ''.join(f"\n{pad}{key!r}: {_to_source(value, indent + 1)}," for key, value in obj.items())
+        return f"{{{items}{end}}}"
+    return repr(obj)
+
+def compile_config(config_file: Union[str, Path]) -> bool:
+    """Write an example configuration out as a Python module that builds it directly
+
+    The module is built from the YAML itself, never from an earlier compiled
+    module or the JSON cache, and records the hashes of the YAML and of the
+    parser source it came from.
+    """
+    module_path = _compiled_module_path(config_file)
+    if module_path is None:
+        return False
+    try:
+        raw = Path(config_file).read_bytes()
+        config = YAMLConfigParser()._parse_config_data(yaml.load(raw, Loader=Loader))
+        module_path.parent.mkdir(exist_ok=True)
+        with open(module_path, 'w', encoding='utf-8') as f:
+            f.write(f"# content-hash: {_content_hash(raw)} {_parser_hash()}\n"
+                    f"# Generated from {Path(config_file).name}, do not edit\n"
+                    "from parser import (EmbeddedConfig, BoardConfig, GPIOConfig, UARTConfig,\n"
+                    "                    I2CConfig, I2CDevice, TimerConfig, SPIConfig)\n\n"
+                    f"CONFIG = {_to_source(config)}\n")
+        return True
+    except (ConfigurationError, OSError, yaml.YAMLError):
+        return False
+
+def _load_compiled(config_file: Union[str, Path]) -> Optional['EmbeddedConfig']:
+    """Import an example's compiled module if it was generated from the current YAML and parser
+
+    The content-hash header is compared before any of the module runs, so
+    timestamps play no part in deciding whether it is current.
+    """
+    module_path = _compiled_module_path(config_file)
+    if module_path is None:
+        return None
+    try:
+        with open(module_path, 'rb') as f:
+            header = f.readline().split()
+        if len(header) != 4 or header[:2] != [b'#', b'content-hash:']:
+            return None
+        # Parser changes count too, the module bakes in its defaults
+        if (header[2].decode() != _content_hash(Path(config_file).read_bytes())
+                or header[3].decode() != _parser_hash()):
+            return None
+        spec = importlib.util.spec_from_file_location(f"_compiled_{module_path.stem}", module_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.CONFIG
+    except Exception:
+        # Missing, stale against the model classes, or otherwise unusable
+        return None
+
+# Pin-carrying keys per top-level section, as read by EmbeddedConfig.get_used_pins_set
+_SECTION_PIN_KEYS = {
+    'gpio': frozenset(('pin',)),
+    'uart': frozenset(('tx_pin', 'rx_pin')),
+    'i2c': frozenset(('scl_pin', 'sda_pin')),
+    'spi': frozenset(('sck_pin', 'miso_pin', 'mosi_pin', 'cs_pins')),
+    'timers': frozenset(('output_pin',))
+}
+
+def _scalar_value(event: yaml.ScalarEvent) -> Any:
+    """Resolve a scalar event to the value the safe loader would produce"""
+    tag = event.tag
+    if tag is None or tag == '!':
+        tag = yaml.resolver.Resolver().resolve(yaml.ScalarNode, event.value, event.implicit)
+    node = yaml.ScalarNode(tag, event.value, style=event.style)
+    return yaml.constructor.SafeConstructor().construct_object(node)
+
+def _is_null(event: yaml.ScalarEvent) -> bool:
+    """Check for an empty string or a plain null scalar (~ or null)"""
+    # libyaml reports plain style as '', the pure Python parser as None
+    return not event.value or (not event.style and event.value in ('~', 'null', 'Null', 'NULL'))
+
+def scan_pins(config_file: Union[str, Path]) -> Set[str]:
+    """Collect used pins from YAML parse events, without building the config objects
+
+    Matches EmbeddedConfig.get_used_pins_set: GPIO pins always count, peripheral
+    pins only when the peripheral is enabled. Files that use aliases are loaded
+    in full, since the event stream does not resolve them.
+    """
+    pins = set()
+    # One frame per open mapping/sequence: [is_mapping, section, pending_key,
+    # own_pins, enabled, is_pin_list]
+    stack = []
+    documents = 0
+    try:
+        with open(config_file, 'rb') as file:
+            for event in yaml.parse(file, Loader=Loader):
+                if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                    section, key, pin_list = None, None, False
+                    if stack:
+                        parent = stack[-1]
+                        if parent[0]:
+                            key, parent[2] = parent[2], None
+                        section = parent[1] if len(stack) > 1 else key
+                        pin_list = key in _SECTION_PIN_KEYS.get(section, ())
+                    stack.append([isinstance(event, yaml.MappingStartEvent),
+                                  section, None, [], None, pin_list])
+                elif isinstance(event, yaml.ScalarEvent):
+                    frame = stack[-1]
+                    if not frame[0]:
+                        if frame[5] and not _is_null(event):
+                            frame[3].append(event.value)
+                    elif frame[2] is None:
+                        frame[2] = event.value
+                    else:
+                        key, frame[2] = frame[2], None
+                        if key in _SECTION_PIN_KEYS.get(frame[1], ()):
+                            if not _is_null(event):
+                                frame[3].append(event.value)
+                        elif key == 'enabled':
+                            frame[4] = bool(_scalar_value(event))
+                elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                    frame = stack.pop()
+                    if frame[5]:
+                        # cs_pins list belongs to the enclosing peripheral
+                        stack[-1][3].extend(frame[3])
+                    elif frame[4] or frame[1] == 'gpio':
+                        pins.update(frame[3])
+                elif isinstance(event, yaml.AliasEvent):
+                    config = YAMLConfigParser().load_config(config_file)
+                    return config.get_used_pins_set()
+                elif isinstance(event, yaml.DocumentStartEvent):
+                    # load_config refuses multi-document streams, so must the scan
+                    documents += 1
+                    if documents > 1:
+                        raise ConfigurationError("YAML parsing error: expected a single document in the stream "
+                                                 f"but found another document ({event.start_mark.name}, "
+                                                 f"line {event.start_mark.line + 1})")
+    except FileNotFoundError:
+        raise ConfigurationError(f"Configuration file not found: {config_file}")
+    except yaml.YAMLError as e:
+        raise ConfigurationError(f"YAML parsing error: {e}")
+
+    return pins
+
+def _field_defaults(cls: type, skip: Tuple[str, ...] = (), **required: Any) -> Dict[str, Any]:
+    """Build a model's parse-time defaults from its dataclass fields
+
+    Optional fields take their declared default; required fields need a value
+    in required, so a new field without one fails at import, not at parse time.
+    """
+    defaults = {}
+    for f in fields(cls):
+        if f.name in skip:
+            continue
+        if f.default is not MISSING:
+            defaults[f.name] = f.default
+        elif f.default_factory is not MISSING:
+            defaults[f.name] = f.default_factory()
+        else:
+            defaults[f.name] = required[f.name]
+    return defaults
+
+# Field defaults applied to raw YAML mappings; names and nested lists are set separately
+_BOARD_DEFAULTS = _field_defaults(BoardConfig, name='', mcu='', clock_frequency=0)
+_GPIO_DEFAULTS = _field_defaults(GPIOConfig, pin='', direction='')
+_UART_DEFAULTS = _field_defaults(UARTConfig, ('name',), enabled=False, baudrate=115200)
+_I2C_DEVICE_DEFAULTS = _field_defaults(I2CDevice, name='', address=0, device_type='')
+_I2C_DEFAULTS = _field_defaults(I2CConfig, ('name', 'devices'), enabled=False, speed=100000,
+                                scl_pin='', sda_pin='')
+_TIMER_DEFAULTS = _field_defaults(TimerConfig, ('name',), enabled=False, prescaler=1, period=1000)
+_SPI_DEFAULTS = _field_defaults(SPIConfig, ('name',), enabled=False, mode=0, speed=1000000)
+
+def _with_defaults(defaults: Dict[str, Any], raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Overlay raw YAML values on a defaults template, ignoring keys the template lacks"""
+    values = defaults.copy()
+    for key in raw.keys() & defaults.keys():
+        values[key] = raw[key]
+    return values
+
+def _intern_pin(value: Any) -> Any:
+    """Intern a pin name so repeated references share one string object"""
+    return sys.intern(value) if type(value) is str else value
+
+def _parse_gpio(raw: Dict[str, Any]) -> GPIOConfig:
+    """Parse one GPIO entry"""
+    values = _with_defaults(_GPIO_DEFAULTS, raw)
+    values['pin'] = _intern_pin(values['pin'])
+    return GPIOConfig(**values)
+
+def _parse_i2c_device(raw: Dict[str, Any]) -> I2CDevice:
+    """Parse one I2C device, accepting 'type' as an alias of 'device_type'"""
+    values = _with_defaults(_I2C_DEVICE_DEFAULTS, raw)
+    if 'device_type' not in raw:
+        values['device_type'] = raw.get('type', '')
+    return I2CDevice(**values)
+
+def _add_i2c_devices(raw: Dict[str, Any], values: Dict[str, Any]) -> None:
+    """Parse an I2C bus's devices"""
+    values['devices'] = [_parse_i2c_device(device_data) for device_data in raw.get('devices', ())]
+
+def _intern_cs_pins(raw: Dict[str, Any], values: Dict[str, Any]) -> None:
+    """Intern each SPI chip-select pin"""
+    values['cs_pins'] = [_intern_pin(pin) for pin in values['cs_pins']]
+
+# Named peripheral sections: (YAML/EmbeddedConfig key, model, defaults, pin fields, extra step)
+_PERIPHERAL_SPECS = (
+    ('uart', UARTConfig, _UART_DEFAULTS, ('tx_pin', 'rx_pin'), None),
+    ('i2c', I2CConfig, _I2C_DEFAULTS, ('scl_pin', 'sda_pin'), _add_i2c_devices),
+    ('timers', TimerConfig, _TIMER_DEFAULTS, ('output_pin',), None),
+    ('spi', SPIConfig, _SPI_DEFAULTS, ('sck_pin', 'miso_pin', 'mosi_pin'), _intern_cs_pins)
+)
+
+@lru_cache(maxsize=32)
+def _load_cached(config_file: str, abspath: str, mtime_ns: int, size: int,
+                 enabled_only: bool = False) -> 'EmbeddedConfig':
+    """Load a configuration once per process for a given file version
+
+    Only config_file is read; the absolute path, mtime and size make up the
+    cache key so an edited file, or a changed working directory, misses.
+    """
+    # Compiled modules hold the full configuration
+    if not enabled_only:
+        config = _load_compiled(config_file)
+        if config is not None:
+            return config
+
+    data = _read_json_cache(config_file)
+    if data is None:
+        data, version = _load_yaml(config_file)
+        _write_json_cache(config_file, data, version)
+    return YAMLConfigParser()._parse_config_data(data, enabled_only)
+
+# GPIO summary table columns, in display order
+_GPIO_ROW = attrgetter('pin', 'direction', 'pull', 'speed', 'description')
+
+def _device_preview(devices: List[I2CDevice]) -> str:
+    """First two I2C devices as name@address, noting how many more there are"""
+    device_list = ", ".join(f"{d.name}@0x{d.address:02X}" for d in devices[:2])
+    if len(devices) > 2:
+        device_list += f" (+{len(devices)-2} more)"
+    return device_list
+
+def _timer_output(timer: TimerConfig) -> str:
+    """PWM output pin and duty cycle of a timer, empty for other modes"""
+    if timer.mode == "pwm" and timer.output_pin:
+        return f"{timer.output_pin} ({timer.duty_cycle}%)"
+    return ""
+
+def _spi_pins(spi: SPIConfig) -> str:
+    """SPI bus pins as one compact string"""
+    pins_info = f"SCK:{spi.sck_pin} MISO:{spi.miso_pin} MOSI:{spi.mosi_pin}"
+    if spi.cs_pins:
+        pins_info += f" CS:{','.join(spi.cs_pins)}"
+    return pins_info
+
+class YAMLConfigParser:
+    """YAML-based embedded peripheral configuration parser"""
+
+    def __init__(self):
+        self.config: Optional[EmbeddedConfig] = None
+        # Rendered JSON of the config it was rendered from, reused by repeat exports
+        self._json_cache: Optional[Tuple[EmbeddedConfig, str]] = None
+
+    def load_config(self, config_file: Union[str, Path], reload: bool = False,
+                    enabled_only: bool = False) -> EmbeddedConfig:
+        """Load and parse YAML configuration file
+
+        Loads are memoized per process, so repeated calls for an unchanged file
+        return the same EmbeddedConfig instance; callers must not mutate it.
+        Pass reload=True to drop the memoized configurations first, and
+        enabled_only=True to leave disabled UART/I2C/Timer/SPI entries out.
+        """
+        try:
+            if reload:
+                _load_cached.cache_clear()
+            stat = os.stat(config_file)
+            self.config = _load_cached(os.fspath(config_file), os.path.abspath(config_file),
+                                       stat.st_mtime_ns, stat.st_size, enabled_only)
+            return self.config
+        except FileNotFoundError:
+            raise ConfigurationError(f"Configuration file not found: {config_file}")
+        except yaml.YAMLError as e:
+            raise ConfigurationError(f"YAML parsing error: {e}")
+        except Exception as e:
+            raise ConfigurationError(f"Error loading configuration: {e}")
+
+    def _parse_config_data(self, data: Dict[str, Any], enabled_only: bool = False) -> EmbeddedConfig:
+        """Parse configuration data into structured objects"""
+        try:
+            # Parse board configuration
+            if 'board' not in data:
+                raise ConfigurationError("Board configuration is required")
+
+            board = BoardConfig(**_with_defaults(_BOARD_DEFAULTS, data['board']))
+
+            # Parse GPIO configurations
+            gpio_configs = [_parse_gpio(gpio_data) for gpio_data in data.get('gpio', ())]
+
+            # Parse UART, I2C, Timer and SPI configurations
+            peripherals = {
+                key: self._parse_named_map(data.get(key, {}), *spec, enabled_only)
+                for key, *spec in _PERIPHERAL_SPECS
+            }
+
+            # Create final configuration
+            return EmbeddedConfig(board=board, gpio=gpio_configs, **peripherals)
+
+        except Exception as e:
+            raise ConfigurationError(f"Error parsing configuration data: {e}")
+
+    def _parse_named_map(self, block: Dict[str, Any], cls: type, defaults: Dict[str, Any],
+                         pin_fields: tuple, extra, enabled_only: bool = False) -> Dict[str, Any]:
+        """Parse a name -> settings mapping of one peripheral type"""
+        parsed = {}
+        for name, raw in block.items():
+            if enabled_only and not raw.get('enabled', False):
+                continue
+            values = _with_defaults(defaults, raw)
+            for pin_field in pin_fields:
+                values[pin_field] = _intern_pin(values[pin_field])
+            if extra is not None:
+                extra(raw, values)
+            parsed[name] = cls(name=name, **values)
+        return parsed
+
+    def export_to_json(self, output_file: Union[str, Path]) -> None:
+        """Export configuration to JSON file"""
+        if not self.config:
+            raise ConfigurationError("No configuration loaded")
+
+        if self._json_cache is None or self._json_cache[0] is not self.config:
+            buffer = io.StringIO()
+            self.config.dump_json(buffer)
+            self._json_cache = (self.config, buffer.getvalue())
+
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(self._json_cache[1])
+
+        console.print(f"[green]Configuration exported to: {output_file}[/green]")
+
+    def generate_summary_report(self) -> None:
+        """Generate a comprehensive summary report"""
+        if not self.config:
+            console.print("[red]No configuration loaded[/red]")
+            return
+
+        sections = self._summary_sections()
+
+        # Pipes and files get plain lines, skipping rich's table layout
+        if not console.is_terminal:
+            write = console.file.write
+            for title, columns, rows, show_header in sections:
+                write(f"{title}\n")
+                if show_header:
+                    write("  " + " | ".join(name for name, _ in columns) + "\n")
+                for row in rows:
+                    write("  " + " | ".join("" if cell is None else str(cell) for cell in row) + "\n")
+                write("\n")
+            return
+
+        for title, columns, rows, show_header in sections:
+            table = Table(title=title, show_header=show_header)
+            for name, style in columns:
+                table.add_column(name, style=style)
+            add_row = table.add_row
+            for row in rows:
+                add_row(*row)
+            console.print(table)
+
+    def _summary_sections(self):
+        """Yield (title, columns, rows, show_header) for each non-empty report section"""
+        config = self.config
+        board = config.board
+        gpio = config.gpio
+
+        # Board information
+        board_rows = [
+            ("Name", board.name),
+            ("MCU", board.mcu),
+            ("Clock", f"{board.clock_frequency:,} Hz"),
+            ("Voltage", f"{board.voltage}V")
+        ]
+        if board.description:
+            board_rows.append(("Description", board.description))
+        yield ("📋 Board Configuration", (("Property", "cyan"), ("Value", "yellow")), board_rows, False)
+
+        # Enabled peripherals come from the config's precomputed index
+        enabled = config.enabled_peripherals
+
+        # GPIO summary, rows straight from attrgetter, one C-level tuple per pin
+        if gpio:
+            yield (
+                f"🔌 GPIO Configuration ({len(gpio)} pins)",
+                (("Pin", "cyan"), ("Direction", "green"), ("Pull", "blue"), ("Speed", "magenta"),
+                 ("Description", "yellow")),
+                map(_GPIO_ROW, gpio),
+                True
+            )
+
+        # UART summary
+        enabled_uart = enabled["uart"]
+        if enabled_uart:
+            yield (
+                f"📡 UART Configuration ({len(enabled_uart)} enabled)",
+                (("Interface", "cyan"), ("Baudrate", "green"), ("TX Pin", "blue"), ("RX Pin", "blue"),
+                 ("Description", "yellow")),
+                ((uart.name, f"{uart.baudrate:,}", uart.tx_pin, uart.rx_pin, uart.description)
+                 for _, uart in enabled_uart),
+                True
+            )
+
+        # I2C summary
+        enabled_i2c = enabled["i2c"]
+        if enabled_i2c:
+            yield (
+                f"🔗 I2C Configuration ({len(enabled_i2c)} buses)",
+                (("Bus", "cyan"), ("Speed", "green"), ("SCL Pin", "blue"), ("SDA Pin", "blue"),
+                 ("Devices", "magenta"), ("Description", "yellow")),
+                ((i2c.name, f"{i2c.speed:,} Hz", i2c.scl_pin, i2c.sda_pin, _device_preview(i2c.devices),
+                  i2c.description) for _, i2c in enabled_i2c),
+                True
+            )
+
+        # Timer summary
+        enabled_timers = enabled["timers"]
+        if enabled_timers:
+            yield (
+                f"⏱️  Timer Configuration ({len(enabled_timers)} enabled)",
+                (("Timer", "cyan"), ("Mode", "green"), ("Prescaler", "blue"), ("Period", "magenta"),
+                 ("Output", "yellow")),
+                ((timer.name, timer.mode, str(timer.prescaler), str(timer.period), _timer_output(timer))
+                 for _, timer in enabled_timers),
+                True
+            )
+
+        # SPI summary
+        enabled_spi = enabled["spi"]
+        if enabled_spi:
+            yield (
+                f"🔄 SPI Configuration ({len(enabled_spi)} enabled)",
+                (("Interface", "cyan"), ("Mode", "green"), ("Speed", "blue"), ("Pins", "magenta"),
+                 ("Description", "yellow")),
+                ((spi.name, f"Mode {spi.mode}", f"{spi.speed:,} Hz", _spi_pins(spi), spi.description)
+                 for _, spi in enabled_spi),
+                True
+            )
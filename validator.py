@@ -3,14 +3,16 @@
 Configuration Validation System using JSON Schemas
 """
 
-import json
 import re
+from collections import defaultdict
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set, Tuple
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from rich.console import Console
-import jsonschema
+
+from common import SLOTS, json_loads
 
 # Console for rich output
 console = Console()
@@ -25,7 +27,7 @@ class ValidationLevel(Enum):
     WARNING = "warning"
     INFO = "info"
 
-@dataclass
+@dataclass(**SLOTS)
 class ValidationMessage:
     """Single validation message"""
     level: ValidationLevel
@@ -39,7 +41,7 @@ class ValidationMessage:
         location_str = f"{self.location}: " if self.location else ""
         return f"{prefix} {location_str}{self.message}"
 
-@dataclass
+@dataclass(**SLOTS)
 class ValidationResult:
     """Complete validation result"""
     is_valid: bool = True
@@ -95,16 +97,16 @@ class ValidationResult:
             self.is_valid = False
     
     def has_errors(self) -> bool:
-        return len(self.errors) > 0
+        return any(msg.level == ValidationLevel.ERROR for msg in self.messages)
     
     def has_warnings(self) -> bool:
-        return len(self.warnings) > 0
+        return any(msg.level == ValidationLevel.WARNING for msg in self.messages)
 
 # ============================================================================
 # PIN MAPPING AND CONFLICT DETECTION
 # ============================================================================
 
-@dataclass
+@dataclass(**SLOTS)
 class PinMapping:
     """Pin usage mapping for conflict detection"""
     pin: str
@@ -117,21 +119,22 @@ class PinConflictDetector:
     """Efficient pin conflict detection"""
     
     def __init__(self):
-        self.pin_mappings: Dict[str, PinMapping] = {}
+        # Every user of each pin, in the order they were added
+        self.pin_mappings: Dict[str, List[PinMapping]] = defaultdict(list)
+        # (first user, later user) for every usage that found its pin taken
         self.conflicts: List[Tuple[PinMapping, PinMapping]] = []
     
     def add_pin_usage(self, mapping: PinMapping) -> bool:
         """Add pin usage, return True if conflict detected"""
-        if mapping.pin in self.pin_mappings:
-            existing = self.pin_mappings[mapping.pin]
-            self.conflicts.append((existing, mapping))
+        bucket = self.pin_mappings[mapping.pin]
+        bucket.append(mapping)
+        if len(bucket) > 1:
+            self.conflicts.append((bucket[0], mapping))
             return True
-        
-        self.pin_mappings[mapping.pin] = mapping
         return False
     
     def get_conflicts(self) -> List[Tuple[PinMapping, PinMapping]]:
-        """Get all detected conflicts"""
+        """Get all detected conflicts, pairing each pin's first user with every later one"""
         return self.conflicts
     
     def clear(self):
@@ -139,121 +142,293 @@ class PinConflictDetector:
         self.pin_mappings.clear()
         self.conflicts.clear()
 
+# ============================================================================
+# INCREMENTAL CONSTRAINT TREE
+# ============================================================================
+
+@dataclass(**SLOTS)
+class ConstraintNode:
+    """Validation outcome for a single peripheral"""
+    peripheral_type: str
+    name: str
+    peripheral: Any
+    result: ValidationResult = field(default_factory=ValidationResult)
+    pin_mappings: List[PinMapping] = field(default_factory=list)
+
+class ConstraintTree:
+    """Per-peripheral validation results keyed on (peripheral_type, name)
+
+    Nodes from the previous run are kept while their peripheral compares equal,
+    so re-validating an edited configuration only re-checks what changed.
+    """
+
+    def __init__(self):
+        self.nodes: Dict[Tuple[str, str], ConstraintNode] = {}
+        self._previous: Dict[Tuple[str, str], ConstraintNode] = {}
+        self._context: Any = None
+
+    def begin(self, context: Any = None):
+        """Start a validation run; a changed context (e.g. MCU specs) drops all nodes"""
+        self._previous = self.nodes if context == self._context else {}
+        self.nodes = {}
+        self._context = context
+
+    def get_node(self, peripheral_type: str, name: str, peripheral: Any) -> Tuple[ConstraintNode, bool]:
+        """Get the node for a peripheral, and whether it is new and needs checking"""
+        key = (peripheral_type, name)
+        node = self._previous.get(key)
+        fresh = node is None or node.peripheral != peripheral
+        if fresh:
+            node = ConstraintNode(peripheral_type, name, peripheral)
+        self.nodes[key] = node
+        return node, fresh
+
 # ============================================================================
 # SCHEMA-DRIVEN MCU SPECS LOADER
 # ============================================================================
 
+@dataclass(frozen=True, **SLOTS)
+class MCUSpec:
+    """MCU limits extracted from a schema file, with derived pin lookup tables"""
+    schema_file: str = ""
+    max_clock: int = 200_000_000
+    min_voltage: float = 1.8
+    max_voltage: float = 5.5
+    gpio_ports: Tuple[str, ...] = ()
+    max_pins_per_port: Dict[str, int] = field(default_factory=dict)
+    uart_count: int = 6
+    i2c_count: int = 3
+    spi_count: int = 6
+    timer_count: int = 14
+    package_type: str = "Unknown"
+    pin_count: int = 0
+    # Every legal pin name (P + port + number) and the ports hint for errors
+    valid_pins: frozenset = field(init=False, repr=False, compare=False)
+    available_ports: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Derive the pin lookup tables once, when the specs are extracted"""
+        max_pins_per_port = self.max_pins_per_port
+        object.__setattr__(self, 'valid_pins', frozenset(
+            f"P{port}{num}" for port in self.gpio_ports for num in range(max_pins_per_port.get(port, 16))
+        ))
+        object.__setattr__(self, 'available_ports', ', '.join(self.gpio_ports))
+
 class SchemaBasedMCUDatabase:
     """Load MCU specifications from schema files"""
     
     def __init__(self, schema_dir: Path = Path("schemas")):
         self.schema_dir = schema_dir
-        self.mcu_specs_cache = {}
-        self._load_all_schemas()
-    
-    def _load_all_schemas(self):
-        """Load all MCU schema files at initialization"""
+        # Case-insensitive prefix trie of compiled patterns:
+        # char -> child node, '' -> [(order, regex, specs)]
+        self._pattern_trie: Dict[str, Any] = {}
+        self._pattern_count = 0
+        # Schema files not parsed yet, in load order; read on demand by find_mcu_specs
+        self._schema_files: List[Path] = self._find_schema_files()
+        # MCU type -> specs found for it; a None result is final, every file was loaded
+        self._specs_cache: Dict[str, Optional[MCUSpec]] = {}
+        # Schema file -> (mtime_ns, compiled validator), see get_validator
+        self._validators: Dict[Path, Tuple[int, Callable[[Any], List[Any]]]] = {}
+
+    def _find_schema_files(self) -> List[Path]:
+        """List the MCU schema files without parsing them"""
         mcu_schema_dir = self.schema_dir / "mcu"
         
         if not mcu_schema_dir.exists():
             console.print(f"Warning: MCU schema directory not found: {mcu_schema_dir}")
-            return
+            return []
         
-        for schema_file in mcu_schema_dir.glob("*.json"):
-            try:
-                with open(schema_file) as f:
-                    schema = json.load(f)
-                
-                # Extract schema name and MCU patterns
-                schema_name = schema_file.stem  # e.g., "STM32F407Vxxx"
-                mcu_patterns = schema.get('mcu_patterns', [])
-                
-                # Extract specs from schema
-                specs = self._extract_specs_from_schema(schema)
-                specs['schema_file'] = schema_name
-                
-                # Store specs with patterns as keys
-                for pattern in mcu_patterns:
-                    self.mcu_specs_cache[pattern.lower()] = specs
-                
-                console.print(f"Loaded MCU specs for {schema_name}: {len(mcu_patterns)} patterns")
-                
-            except Exception as e:
-                console.print(f"Warning: Could not load schema {schema_file}: {e}")
+        return list(mcu_schema_dir.glob("*.json"))
     
-    def _extract_specs_from_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract MCU specifications from JSON schema"""
-        specs = {}
+    def _load_schema(self, schema_file: Path):
+        """Parse one MCU schema file and index its patterns"""
+        try:
+            schema = json_loads(schema_file.read_bytes())
+
+            # Extract schema name and MCU patterns
+            schema_name = schema_file.stem  # e.g., "STM32F407Vxxx"
+            mcu_patterns = schema.get('mcu_patterns', [])
+
+            # Extract specs from schema
+            specs = self._extract_specs_from_schema(schema, schema_name)
+
+            # Index specs by pattern
+            for pattern in mcu_patterns:
+                self._add_pattern(pattern, specs)
+
+            console.print(f"Loaded MCU specs for {schema_name}: {len(mcu_patterns)} patterns")
+
+        except Exception as e:
+            console.print(f"Warning: Could not load schema {schema_file}: {e}")
+
+    def _add_pattern(self, pattern: str, specs: MCUSpec):
+        """Compile an MCU pattern once and index it by its literal prefix"""
+        # Convert simple wildcards to regex
+        regex_pattern = pattern.replace('*', '.*').replace('?', '.')
+        try:
+            regex = re.compile(f"^{regex_pattern}$", re.IGNORECASE)
+        except re.error as e:
+            console.print(f"Warning: Invalid MCU pattern {pattern}: {e}")
+            return
         
+        # Both cases of a letter share one child, so lookups need no lower()
+        node = self._pattern_trie
+        for char in self._literal_prefix(regex_pattern):
+            child = node.get(char.lower())
+            if child is None:
+                child = node[char.lower()] = node[char.upper()] = {}
+            node = child
+        node.setdefault('', []).append((self._pattern_count, regex, specs))
+        self._pattern_count += 1
+
+    @staticmethod
+    def _literal_prefix(regex_pattern: str) -> str:
+        """Get the leading characters every match of the pattern must start with"""
+        if '|' in regex_pattern:
+            return ''
+
+        prefix = []
+        for char in regex_pattern:
+            if char in '.^$*+?{}[]()\\':
+                # A quantifier may make the previous character optional
+                if char in '*?{' and prefix:
+                    prefix.pop()
+                break
+            prefix.append(char)
+        return ''.join(prefix)
+
+    def _extract_specs_from_schema(self, schema: Dict[str, Any], schema_name: str) -> MCUSpec:
+        """Extract MCU specifications from JSON schema"""
         try:
             # Get package constraints
             package_constraints = schema.get('package_constraints', {})
             
             # Extract GPIO port information
             gpio_ports = package_constraints.get('gpio_ports', {})
-            specs['gpio_ports'] = list(gpio_ports.keys())
-            specs['max_pins_per_port'] = {
-                port: info.get('max', 15) + 1  # max+1 for pin count
-                for port, info in gpio_ports.items()
-            }
             
             # Extract peripheral limits
             peripheral_limits = package_constraints.get('peripheral_limits', {})
-            specs['uart_count'] = peripheral_limits.get('uart_count', 6)
-            specs['i2c_count'] = peripheral_limits.get('i2c_count', 3)
-            specs['spi_count'] = peripheral_limits.get('spi_count', 6)
-            specs['timer_count'] = peripheral_limits.get('timer_count', 14)
             
             # Extract clock and voltage limits from board properties
             board_props = schema.get('properties', {}).get('board', {}).get('properties', {})
-            
             clock_props = board_props.get('clock_frequency', {})
-            specs['max_clock'] = clock_props.get('maximum', 200_000_000)
-            
             voltage_props = board_props.get('voltage', {})
-            specs['min_voltage'] = voltage_props.get('minimum', 1.8)
-            specs['max_voltage'] = voltage_props.get('maximum', 5.5)
             
             # Get package info
             package_info = schema.get('package_info', {})
-            specs['package_type'] = package_info.get('package_type', 'Unknown')
-            specs['pin_count'] = package_info.get('pin_count', 0)
+
+            return MCUSpec(
+                schema_file=schema_name,
+                max_clock=clock_props.get('maximum', 200_000_000),
+                min_voltage=voltage_props.get('minimum', 1.8),
+                max_voltage=voltage_props.get('maximum', 5.5),
+                gpio_ports=tuple(gpio_ports.keys()),
+                max_pins_per_port={
+                    port: info.get('max', 15) + 1  # max+1 for pin count
+                    for port, info in gpio_ports.items()
+                },
+                uart_count=peripheral_limits.get('uart_count', 6),
+                i2c_count=peripheral_limits.get('i2c_count', 3),
+                spi_count=peripheral_limits.get('spi_count', 6),
+                timer_count=peripheral_limits.get('timer_count', 14),
+                package_type=package_info.get('package_type', 'Unknown'),
+                pin_count=package_info.get('pin_count', 0)
+            )
             
         except Exception as e:
             console.print(f"Warning: Error extracting specs from schema: {e}")
             # Return minimal fallback specs
-            specs = {
-                'max_clock': 200_000_000,
-                'min_voltage': 1.8,
-                'max_voltage': 5.5,
-                'gpio_ports': ['A', 'B', 'C', 'D', 'E'],
-                'max_pins_per_port': {port: 16 for port in ['A', 'B', 'C', 'D', 'E']},
-                'uart_count': 6,
-                'i2c_count': 3,
-                'spi_count': 6,
-                'timer_count': 14,
-                'package_type': 'Unknown',
-                'pin_count': 0
-            }
+            fallback_ports = ('A', 'B', 'C', 'D', 'E')
+            return MCUSpec(
+                schema_file=schema_name,
+                gpio_ports=fallback_ports,
+                max_pins_per_port={port: 16 for port in fallback_ports}
+            )
+
+    def find_mcu_specs(self, mcu_type: str) -> Optional[MCUSpec]:
+        """Find MCU specs by matching against patterns, loading schemas only as needed"""
+        try:
+            return self._specs_cache[mcu_type]
+        except KeyError:
+            pass
+
+        specs = self._match_loaded(mcu_type)
+
+        # Later files only add later patterns, so the first hit is the same
+        # one a fully loaded database would give
+        while specs is None and self._schema_files:
+            self._load_schema(self._schema_files.pop(0))
+            specs = self._match_loaded(mcu_type)
         
+        self._specs_cache[mcu_type] = specs
         return specs
     
-    def find_mcu_specs(self, mcu_type: str) -> Optional[Dict[str, Any]]:
-        """Find MCU specs by matching against patterns"""
-        mcu_lower = mcu_type.lower()
-        
-        # Direct pattern matching
-        for pattern, specs in self.mcu_specs_cache.items():
-            if self._match_pattern(mcu_lower, pattern):
+    def _match_loaded(self, mcu_type: str) -> Optional[MCUSpec]:
+        """Match against the patterns of the schemas loaded so far"""
+        # Gather patterns whose literal prefix matches, then try them in load order
+        node = self._pattern_trie
+        candidates = list(node.get('', ()))
+        for char in mcu_type:
+            node = node.get(char)
+            if node is None:
+                break
+            candidates.extend(node.get('', ()))
+
+        candidates.sort(key=lambda candidate: candidate[0])
+        for _, regex, specs in candidates:
+            if regex.match(mcu_type):
                 return specs
         
         return None
     
-    def _match_pattern(self, mcu_type: str, pattern: str) -> bool:
-        """Match MCU type against pattern (supports wildcards)"""
-        # Convert simple wildcards to regex
-        regex_pattern = pattern.replace('*', '.*').replace('?', '.')
-        return bool(re.match(f"^{regex_pattern}$", mcu_type))
+    def get_validator(self, schema_file: Path) -> Callable[[Any], List[Any]]:
+        """Get a validation function for a schema file, compiled once per file version
+
+        The function returns every jsonschema.ValidationError for an instance,
+        an empty list when it is valid.
+        """
+        mtime_ns = schema_file.stat().st_mtime_ns
+        cached = self._validators.get(schema_file)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        validate = self._compile_validator(schema_file)
+        self._validators[schema_file] = (mtime_ns, validate)
+        return validate
+
+    @staticmethod
+    def _compile_validator(schema_file: Path) -> Callable[[Any], List[Any]]:
+        """Build a validator, checking instances with fastjsonschema when it is installed"""
+        # Imported on first use, jsonschema is slow to import
+        import jsonschema
+
+        schema = json_loads(schema_file.read_bytes())
+        validator_cls = jsonschema.validators.validator_for(schema)
+        validator_cls.check_schema(schema)
+        validator = validator_cls(schema)
+
+        def find_errors(instance):
+            return list(validator.iter_errors(instance))
+
+        # fastjsonschema generates Python code for the schema; jsonschema then
+        # only runs to describe a failure, so messages stay the same either way
+        try:
+            import fastjsonschema
+            check = fastjsonschema.compile(schema)
+        except ImportError:
+            return find_errors
+        except Exception:
+            # Schema features fastjsonschema cannot compile
+            return find_errors
+
+        def validate(instance):
+            try:
+                check(instance)
+            except fastjsonschema.JsonSchemaException:
+                return find_errors(instance)
+            return []
+
+        return validate
 
 # ============================================================================
 # SCHEMA-DRIVEN VALIDATORS
@@ -265,14 +440,16 @@ class SchemaBasedPinValidator:
     def __init__(self, mcu_database: SchemaBasedMCUDatabase):
         self.mcu_database = mcu_database
         self.conflict_detector = PinConflictDetector()
+        self.constraint_tree = ConstraintTree()
     
-    def validate(self, config) -> ValidationResult:
-        """Validate pin configuration using schema-derived specs"""
+    def validate(self, config, mcu_specs: Optional[MCUSpec] = None) -> ValidationResult:
+        """Validate pin configuration using schema-derived specs, looked up unless given"""
         result = ValidationResult()
         self.conflict_detector.clear()
         
         # Get MCU specs from schema
-        mcu_specs = self.mcu_database.find_mcu_specs(config.board.mcu)
+        if mcu_specs is None:
+            mcu_specs = self.mcu_database.find_mcu_specs(config.board.mcu)
         if not mcu_specs:
             result.add_error(
                 f"No schema found for MCU: {config.board.mcu}",
@@ -282,12 +459,9 @@ class SchemaBasedPinValidator:
             )
             return result
         
-        # Collect all pin usages
-        self._collect_gpio_pins(config, result, mcu_specs)
-        self._collect_uart_pins(config, result, mcu_specs)
-        self._collect_i2c_pins(config, result, mcu_specs)
-        self._collect_spi_pins(config, result, mcu_specs)
-        self._collect_timer_pins(config, result, mcu_specs)
+        # Collect all pin usages, reusing unchanged peripherals from the last run
+        self.constraint_tree.begin(mcu_specs)
+        self._collect_pins(config, result, mcu_specs)
         
         # Report conflicts
         conflicts = self.conflict_detector.get_conflicts()
@@ -301,168 +475,73 @@ class SchemaBasedPinValidator:
         
         return result
     
-    def _validate_pin_against_schema(self, pin: str, mcu_specs: Dict[str, Any]) -> bool:
-        """Validate pin against schema-derived constraints"""
-        if len(pin) < 2 or pin[0] != 'P':
-            return False
-        
-        port = pin[1]
-        try:
-            pin_num = int(pin[2:])
-        except ValueError:
-            return False
-        
-        # Check if port exists
-        if port not in mcu_specs.get('gpio_ports', []):
-            return False
-        
-        # Check if pin number is valid for this port
-        max_pins_per_port = mcu_specs.get('max_pins_per_port', {})
-        max_pin = max_pins_per_port.get(port, 16)
-        
-        return 0 <= pin_num < max_pin
-    
-    def _collect_gpio_pins(self, config, result: ValidationResult, mcu_specs: Dict[str, Any]):
-        """Collect GPIO pin mappings with schema validation"""
-        for i, gpio in enumerate(config.gpio):
-            if not self._validate_pin_against_schema(gpio.pin, mcu_specs):
-                available_ports = ', '.join(mcu_specs.get('gpio_ports', []))
-                result.add_error(
-                    f"Invalid GPIO pin: {gpio.pin}",
-                    location=f"gpio[{i}]",
-                    category="pin_format",
-                    suggestion=f"Use pins from available ports: {available_ports}"
-                )
-                continue
-            
-            mapping = PinMapping(
-                pin=gpio.pin,
-                usage_type="GPIO",
-                peripheral=f"GPIO ({gpio.direction})",
-                description=gpio.description,
-                config_location=f"gpio[{i}]"
-            )
+    def _merge_node(self, node: ConstraintNode, result: ValidationResult):
+        """Merge a peripheral's pin errors and register its pin usages"""
+        result.merge(node.result)
+        for mapping in node.pin_mappings:
             self.conflict_detector.add_pin_usage(mapping)
     
-    def _collect_uart_pins(self, config, result: ValidationResult, mcu_specs: Dict[str, Any]):
-        """Collect UART pin mappings with schema validation"""
-        for uart_name, uart in config.uart.items():
-            if not uart.enabled:
-                continue
-            
-            for pin_type, pin in [("TX", uart.tx_pin), ("RX", uart.rx_pin)]:
-                if not pin:
-                    continue
-                
-                if not self._validate_pin_against_schema(pin, mcu_specs):
-                    available_ports = ', '.join(mcu_specs.get('gpio_ports', []))
-                    result.add_error(
-                        f"Invalid UART {uart_name} {pin_type} pin: {pin}",
-                        location=f"uart.{uart_name}",
-                        category="pin_format",
-                        suggestion=f"Use pins from available ports: {available_ports}"
-                    )
-                    continue
-                
-                mapping = PinMapping(
-                    pin=pin,
-                    usage_type="UART",
-                    peripheral=f"UART {uart_name} {pin_type}",
-                    description=uart.description,
-                    config_location=f"uart.{uart_name}"
-                )
-                self.conflict_detector.add_pin_usage(mapping)
-    
-    def _collect_i2c_pins(self, config, result: ValidationResult, mcu_specs: Dict[str, Any]):
-        """Collect I2C pin mappings with schema validation"""
-        for i2c_name, i2c in config.i2c.items():
-            if not i2c.enabled:
-                continue
-            
-            for pin_type, pin in [("SCL", i2c.scl_pin), ("SDA", i2c.sda_pin)]:
-                if not self._validate_pin_against_schema(pin, mcu_specs):
-                    available_ports = ', '.join(mcu_specs.get('gpio_ports', []))
-                    result.add_error(
-                        f"Invalid I2C {i2c_name} {pin_type} pin: {pin}",
-                        location=f"i2c.{i2c_name}",
-                        category="pin_format",
-                        suggestion=f"Use pins from available ports: {available_ports}"
-                    )
-                    continue
-                
-                mapping = PinMapping(
-                    pin=pin,
-                    usage_type="I2C",
-                    peripheral=f"I2C {i2c_name} {pin_type}",
-                    description=i2c.description,
-                    config_location=f"i2c.{i2c_name}"
-                )
-                self.conflict_detector.add_pin_usage(mapping)
-    
-    def _collect_spi_pins(self, config, result: ValidationResult, mcu_specs: Dict[str, Any]):
-        """Collect SPI pin mappings with schema validation"""
-        for spi_name, spi in config.spi.items():
-            if not spi.enabled:
-                continue
-            
-            spi_pins = [
-                ("SCK", spi.sck_pin),
-                ("MISO", spi.miso_pin),
-                ("MOSI", spi.mosi_pin)
-            ]
-            
-            # Add CS pins
-            for i, cs_pin in enumerate(spi.cs_pins):
-                spi_pins.append((f"CS{i}", cs_pin))
-            
-            for pin_type, pin in spi_pins:
-                if not pin:
-                    continue
-                
-                if not self._validate_pin_against_schema(pin, mcu_specs):
-                    available_ports = ', '.join(mcu_specs.get('gpio_ports', []))
-                    result.add_error(
-                        f"Invalid SPI {spi_name} {pin_type} pin: {pin}",
-                        location=f"spi.{spi_name}",
-                        category="pin_format",
-                        suggestion=f"Use pins from available ports: {available_ports}"
-                    )
-                    continue
-                
-                mapping = PinMapping(
-                    pin=pin,
-                    usage_type="SPI",
-                    peripheral=f"SPI {spi_name} {pin_type}",
-                    description=spi.description,
-                    config_location=f"spi.{spi_name}"
-                )
-                self.conflict_detector.add_pin_usage(mapping)
-    
-    def _collect_timer_pins(self, config, result: ValidationResult, mcu_specs: Dict[str, Any]):
-        """Collect Timer pin mappings with schema validation"""
-        for timer_name, timer in config.timers.items():
-            if not timer.enabled or timer.mode != "pwm" or not timer.output_pin:
-                continue
-            
-            pin = timer.output_pin
-            if not self._validate_pin_against_schema(pin, mcu_specs):
-                available_ports = ', '.join(mcu_specs.get('gpio_ports', []))
-                result.add_error(
-                    f"Invalid Timer {timer_name} PWM pin: {pin}",
-                    location=f"timers.{timer_name}",
-                    category="pin_format",
-                    suggestion=f"Use pins from available ports: {available_ports}"
-                )
-                continue
-            
-            mapping = PinMapping(
-                pin=pin,
-                usage_type="Timer PWM",
-                peripheral=f"Timer {timer_name} PWM",
-                description=timer.description,
-                config_location=f"timers.{timer_name}"
-            )
-            self.conflict_detector.add_pin_usage(mapping)
+    def _collect_pins(self, config, result: ValidationResult, mcu_specs: MCUSpec):
+        """Check every used pin and register its usage, in one pass over the peripherals"""
+        valid_pins = mcu_specs.valid_pins
+        ports_hint = f"Use pins from available ports: {mcu_specs.available_ports}"
+        get_node = self.constraint_tree.get_node
+
+        for peripheral_type, key, peripheral, location, usage_type, pins in self._iter_pin_usages(config):
+            node, fresh = get_node(peripheral_type, key, peripheral)
+            if fresh:
+                # pins is lazy, so labels are only formatted for peripherals checked again
+                for label, mapping_label, pin in pins:
+                    if pin not in valid_pins:
+                        node.result.add_error(
+                            f"Invalid {label} pin: {pin}",
+                            location=location,
+                            category="pin_format",
+                            suggestion=ports_hint
+                        )
+                        continue
+
+                    node.pin_mappings.append(PinMapping(
+                        pin=pin,
+                        usage_type=usage_type,
+                        peripheral=mapping_label,
+                        description=peripheral.description,
+                        config_location=location
+                    ))
+            self._merge_node(node, result)
+
+    @staticmethod
+    def _iter_pin_usages(config):
+        """Yield (type, key, peripheral, location, usage type, pins) for each pin-using peripheral
+
+        pins yields (error label, mapping label, pin); the two labels only
+        differ for GPIO. Disabled peripherals, non-PWM timers and unset
+        optional pins are left out.
+        """
+        for i, gpio in enumerate(config.gpio):
+            yield ("gpio", str(i), gpio, f"gpio[{i}]", "GPIO",
+                   (("GPIO", f"GPIO ({gpio.direction})", gpio.pin),))
+
+        for uart_name, uart in config.enabled_uart:
+            yield ("uart", uart_name, uart, f"uart.{uart_name}", "UART",
+                   ((f"UART {uart_name} {pin_type}",) * 2 + (pin,)
+                    for pin_type, pin in uart.iter_labeled_pins() if pin))
+
+        # I2C bus pins are required, an empty one is reported as invalid
+        for i2c_name, i2c in config.enabled_i2c:
+            yield ("i2c", i2c_name, i2c, f"i2c.{i2c_name}", "I2C",
+                   ((f"I2C {i2c_name} {pin_type}",) * 2 + (pin,)
+                    for pin_type, pin in i2c.iter_labeled_pins()))
+
+        for spi_name, spi in config.enabled_spi:
+            yield ("spi", spi_name, spi, f"spi.{spi_name}", "SPI",
+                   ((f"SPI {spi_name} {pin_type}",) * 2 + (pin,)
+                    for pin_type, pin in spi.iter_labeled_pins() if pin))
+
+        for timer_name, timer in config.enabled_timers:
+            if timer.mode == "pwm" and timer.output_pin:
+                yield ("timers", timer_name, timer, f"timers.{timer_name}", "Timer PWM",
+                       ((f"Timer {timer_name} PWM",) * 2 + (timer.output_pin,),))
 
 class SchemaBasedMCUValidator:
     """Schema-driven MCU validation"""
@@ -470,12 +549,13 @@ class SchemaBasedMCUValidator:
     def __init__(self, mcu_database: SchemaBasedMCUDatabase):
         self.mcu_database = mcu_database
     
-    def validate(self, config) -> ValidationResult:
-        """Validate MCU-specific constraints using schema"""
+    def validate(self, config, mcu_specs: Optional[MCUSpec] = None) -> ValidationResult:
+        """Validate MCU-specific constraints using schema specs, looked up unless given"""
         result = ValidationResult()
         
         # Get MCU specs from schema
-        mcu_specs = self.mcu_database.find_mcu_specs(config.board.mcu)
+        if mcu_specs is None:
+            mcu_specs = self.mcu_database.find_mcu_specs(config.board.mcu)
         
         if not mcu_specs:
             result.add_warning(
@@ -487,7 +567,7 @@ class SchemaBasedMCUValidator:
             return result
         
         # Validate clock frequency
-        max_clock = mcu_specs.get('max_clock', 200_000_000)
+        max_clock = mcu_specs.max_clock
         if config.board.clock_frequency > max_clock:
             result.add_error(
                 f"Clock frequency {config.board.clock_frequency:,}Hz exceeds maximum {max_clock:,}Hz",
@@ -497,8 +577,8 @@ class SchemaBasedMCUValidator:
             )
         
         # Validate voltage range
-        min_voltage = mcu_specs.get('min_voltage', 1.8)
-        max_voltage = mcu_specs.get('max_voltage', 5.5)
+        min_voltage = mcu_specs.min_voltage
+        max_voltage = mcu_specs.max_voltage
         if not (min_voltage <= config.board.voltage <= max_voltage):
             result.add_error(
                 f"Voltage {config.board.voltage}V outside valid range {min_voltage}-{max_voltage}V",
@@ -509,7 +589,7 @@ class SchemaBasedMCUValidator:
         # Validate peripheral counts
         peripheral_counts = config.get_enabled_peripheral_count()
         
-        uart_limit = mcu_specs.get('uart_count', 6)
+        uart_limit = mcu_specs.uart_count
         if peripheral_counts['uart'] > uart_limit:
             result.add_error(
                 f"Too many UART peripherals enabled: {peripheral_counts['uart']} > {uart_limit}",
@@ -517,7 +597,7 @@ class SchemaBasedMCUValidator:
                 category="mcu_limits"
             )
         
-        i2c_limit = mcu_specs.get('i2c_count', 3)
+        i2c_limit = mcu_specs.i2c_count
         if peripheral_counts['i2c'] > i2c_limit:
             result.add_error(
                 f"Too many I2C peripherals enabled: {peripheral_counts['i2c']} > {i2c_limit}",
@@ -525,7 +605,7 @@ class SchemaBasedMCUValidator:
                 category="mcu_limits"
             )
         
-        spi_limit = mcu_specs.get('spi_count', 6)
+        spi_limit = mcu_specs.spi_count
         if peripheral_counts['spi'] > spi_limit:
             result.add_error(
                 f"Too many SPI peripherals enabled: {peripheral_counts['spi']} > {spi_limit}",
@@ -534,8 +614,8 @@ class SchemaBasedMCUValidator:
             )
         
         # Add info about detected MCU
-        package_type = mcu_specs.get('package_type', 'Unknown')
-        pin_count = mcu_specs.get('pin_count', 0)
+        package_type = mcu_specs.package_type
+        pin_count = mcu_specs.pin_count
         result.add_info(
             f"Detected MCU package: {package_type} ({pin_count} pins)",
             category="mcu_detection"
@@ -546,9 +626,13 @@ class SchemaBasedMCUValidator:
 class PeripheralValidator:
     """Peripheral-specific business logic validation"""
     
+    def __init__(self):
+        self.constraint_tree = ConstraintTree()
+
     def validate(self, config) -> ValidationResult:
         """Validate peripheral configurations"""
         result = ValidationResult()
+        self.constraint_tree.begin()
         
         # I2C address conflicts
         self._validate_i2c_addresses(config, result)
@@ -566,117 +650,122 @@ class PeripheralValidator:
     
     def _validate_i2c_addresses(self, config, result: ValidationResult):
         """Check for I2C address conflicts"""
-        for i2c_name, i2c in config.i2c.items():
-            if not i2c.enabled:
-                continue
+        for i2c_name, i2c in config.enabled_i2c:
+            node, fresh = self.constraint_tree.get_node("i2c", i2c_name, i2c)
+            if fresh:
+                addresses = set()
+                for device in i2c.devices:
+                    address = device.address
+                    if address in addresses:
+                        node.result.add_error(
+                            f"I2C address conflict on {i2c_name}: 0x{address:02X} used multiple times",
+                            location=f"i2c.{i2c_name}",
+                            category="i2c_conflict",
+                            suggestion="Use unique I2C addresses for each device"
+                        )
+                    else:
+                        addresses.add(address)
+
+                    # Check reserved addresses
+                    if not 0x08 <= address <= 0x77:
+                        node.result.add_error(
+                            f"Invalid I2C address on {i2c_name}: 0x{address:02X} (must be 0x08-0x77)",
+                            location=f"i2c.{i2c_name}.{device.name}",
+                            category="i2c_address"
+                        )
             
-            addresses = set()
-            for device in i2c.devices:
-                if device.address in addresses:
-                    result.add_error(
-                        f"I2C address conflict on {i2c_name}: 0x{device.address:02X} used multiple times",
-                        location=f"i2c.{i2c_name}",
-                        category="i2c_conflict",
-                        suggestion="Use unique I2C addresses for each device"
-                    )
-                addresses.add(device.address)
-                
-                # Check reserved addresses
-                if device.address < 0x08 or device.address > 0x77:
-                    result.add_error(
-                        f"Invalid I2C address on {i2c_name}: 0x{device.address:02X} (must be 0x08-0x77)",
-                        location=f"i2c.{i2c_name}.{device.name}",
-                        category="i2c_address"
-                    )
+            result.merge(node.result)
     
     def _validate_timer_configs(self, config, result: ValidationResult):
         """Validate timer configurations"""
-        for timer_name, timer in config.timers.items():
-            if not timer.enabled:
-                continue
-            
-            # PWM specific validation
-            if timer.mode == "pwm":
-                if timer.duty_cycle is None or not (0 <= timer.duty_cycle <= 100):
-                    result.add_error(
-                        f"Timer {timer_name}: PWM mode requires duty_cycle between 0-100",
-                        location=f"timers.{timer_name}",
-                        category="timer_config"
-                    )
+        for timer_name, timer in config.enabled_timers:
+            node, fresh = self.constraint_tree.get_node("timers", timer_name, timer)
+            if fresh:
+                # PWM specific validation
+                if timer.mode == "pwm":
+                    if timer.duty_cycle is None or not (0 <= timer.duty_cycle <= 100):
+                        node.result.add_error(
+                            f"Timer {timer_name}: PWM mode requires duty_cycle between 0-100",
+                            location=f"timers.{timer_name}",
+                            category="timer_config"
+                        )
+
+                    if not timer.output_pin:
+                        node.result.add_error(
+                            f"Timer {timer_name}: PWM mode requires output_pin",
+                            location=f"timers.{timer_name}",
+                            category="timer_config"
+                        )
+
+                    if timer.channel is None or not (1 <= timer.channel <= 4):
+                        node.result.add_error(
+                            f"Timer {timer_name}: Invalid PWM channel (must be 1-4)",
+                            location=f"timers.{timer_name}",
+                            category="timer_config"
+                        )
                 
-                if not timer.output_pin:
-                    result.add_error(
-                        f"Timer {timer_name}: PWM mode requires output_pin",
+                # Check prescaler and period values
+                if timer.prescaler <= 0 or timer.prescaler > 65536:
+                    node.result.add_error(
+                        f"Timer {timer_name}: Invalid prescaler value {timer.prescaler} (1-65536)",
                         location=f"timers.{timer_name}",
                         category="timer_config"
                     )
                 
-                if timer.channel is None or not (1 <= timer.channel <= 4):
-                    result.add_error(
-                        f"Timer {timer_name}: Invalid PWM channel (must be 1-4)",
+                if timer.period <= 0 or timer.period > 65536:
+                    node.result.add_error(
+                        f"Timer {timer_name}: Invalid period value {timer.period} (1-65536)",
                         location=f"timers.{timer_name}",
                         category="timer_config"
                     )
             
-            # Check prescaler and period values
-            if timer.prescaler <= 0 or timer.prescaler > 65536:
-                result.add_error(
-                    f"Timer {timer_name}: Invalid prescaler value {timer.prescaler} (1-65536)",
-                    location=f"timers.{timer_name}",
-                    category="timer_config"
-                )
-            
-            if timer.period <= 0 or timer.period > 65536:
-                result.add_error(
-                    f"Timer {timer_name}: Invalid period value {timer.period} (1-65536)",
-                    location=f"timers.{timer_name}",
-                    category="timer_config"
-                )
+            result.merge(node.result)
     
     def _validate_spi_configs(self, config, result: ValidationResult):
         """Validate SPI configurations"""
-        for spi_name, spi in config.spi.items():
-            if not spi.enabled:
-                continue
-            
-            # Required pins check
-            if not spi.sck_pin:
-                result.add_error(
-                    f"SPI {spi_name}: SCK pin is required",
-                    location=f"spi.{spi_name}",
-                    category="spi_config"
-                )
-            
-            if not spi.mosi_pin:
-                result.add_error(
-                    f"SPI {spi_name}: MOSI pin is required",
-                    location=f"spi.{spi_name}",
-                    category="spi_config"
-                )
+        for spi_name, spi in config.enabled_spi:
+            node, fresh = self.constraint_tree.get_node("spi", spi_name, spi)
+            if fresh:
+                # Required pins check
+                if not spi.sck_pin:
+                    node.result.add_error(
+                        f"SPI {spi_name}: SCK pin is required",
+                        location=f"spi.{spi_name}",
+                        category="spi_config"
+                    )
+
+                if not spi.mosi_pin:
+                    node.result.add_error(
+                        f"SPI {spi_name}: MOSI pin is required",
+                        location=f"spi.{spi_name}",
+                        category="spi_config"
+                    )
+
+                # CS pins validation
+                if not spi.cs_pins:
+                    node.result.add_warning(
+                        f"SPI {spi_name}: No CS pins configured",
+                        location=f"spi.{spi_name}",
+                        category="spi_config",
+                        suggestion="Add CS pins for device selection"
+                    )
             
-            # CS pins validation
-            if not spi.cs_pins:
-                result.add_warning(
-                    f"SPI {spi_name}: No CS pins configured",
-                    location=f"spi.{spi_name}",
-                    category="spi_config",
-                    suggestion="Add CS pins for device selection"
-                )
+            result.merge(node.result)
     
     def _validate_uart_configs(self, config, result: ValidationResult):
         """Validate UART configurations"""
-        for uart_name, uart in config.uart.items():
-            if not uart.enabled:
-                continue
-            
-            # Pin validation
-            if not uart.tx_pin and not uart.rx_pin:
-                result.add_warning(
-                    f"UART {uart_name}: No TX or RX pins configured",
-                    location=f"uart.{uart_name}",
-                    category="uart_config",
-                    suggestion="Configure at least TX or RX pin"
-                )
+        for uart_name, uart in config.enabled_uart:
+            node, fresh = self.constraint_tree.get_node("uart", uart_name, uart)
+            if fresh:
+                # Pin validation
+                if not uart.tx_pin and not uart.rx_pin:
+                    node.result.add_warning(
+                        f"UART {uart_name}: No TX or RX pins configured",
+                        location=f"uart.{uart_name}",
+                        category="uart_config",
+                        suggestion="Configure at least TX or RX pin"
+                    )
+            result.merge(node.result)
 
 class SchemaValidator:
     """JSON Schema validation with schema-based MCU discovery"""
@@ -684,22 +773,17 @@ class SchemaValidator:
     def __init__(self, mcu_database: SchemaBasedMCUDatabase):
         self.mcu_database = mcu_database
     
-    def validate(self, config) -> ValidationResult:
-        """Validate using JSON schemas"""
+    def validate(self, config, mcu_specs: Optional[MCUSpec] = None) -> ValidationResult:
+        """Validate using JSON schemas, with MCU specs looked up unless given"""
         result = ValidationResult()
         
-        # Convert config to dict for schema validation
-        from dataclasses import asdict
-        config_dict = asdict(config)
-        
-        # Transform device_type to type for schema compatibility
-        for i2c_name, i2c_config in config_dict.get('i2c', {}).items():
-            for device in i2c_config.get('devices', []):
-                if 'device_type' in device:
-                    device['type'] = device.pop('device_type')
+        # Dict form with device_type renamed to type, built once per config
+        config_dict = config.schema_dict
         
         # MCU schema validation
-        mcu_result = self._validate_mcu_schema(config_dict, config.board.mcu)
+        if mcu_specs is None:
+            mcu_specs = self.mcu_database.find_mcu_specs(config.board.mcu)
+        mcu_result = self._validate_mcu_schema(config_dict, config.board.mcu, mcu_specs)
         result.merge(mcu_result)
         
         # Peripheral schema validation
@@ -708,12 +792,15 @@ class SchemaValidator:
         
         return result
     
-    def _validate_mcu_schema(self, config_data: Dict[str, Any], mcu_type: str) -> ValidationResult:
+    def validate_devices(self, config) -> ValidationResult:
+        """Validate I2C devices against their peripheral schemas only"""
+        return self._validate_peripheral_schemas(config.schema_dict)
+
+    def _validate_mcu_schema(self, config_data: Dict[str, Any], mcu_type: str,
+                             mcu_specs: Optional[MCUSpec]) -> ValidationResult:
         """Validate against MCU-specific schema"""
         result = ValidationResult()
         
-        # Find schema using MCU database
-        mcu_specs = self.mcu_database.find_mcu_specs(mcu_type)
         if not mcu_specs:
             result.add_info(
                 f"No schema found for MCU: {mcu_type}",
@@ -721,28 +808,28 @@ class SchemaValidator:
             )
             return result
         
-        schema_file_name = mcu_specs.get('schema_file')
+        schema_file_name = mcu_specs.schema_file
         schema_file = self.mcu_database.schema_dir / "mcu" / f"{schema_file_name}.json"
         
         try:
-            with open(schema_file) as f:
-                schema = json.load(f)
-            
-            jsonschema.validate(config_data, schema)
-            result.add_info(f"MCU schema validation passed for {schema_file_name}", category="schema_validation")
-            
-        except jsonschema.ValidationError as e:
+            errors = self.mcu_database.get_validator(schema_file)(config_data)
+        except Exception as e:
+            result.add_warning(
+                f"Schema loading error for {schema_file_name}: {e}",
+                category="schema_error"
+            )
+            return result
+
+        # Report every violation in one pass
+        for e in errors:
             error_path = " -> ".join(str(p) for p in e.absolute_path) if e.absolute_path else "root"
             result.add_error(
                 f"MCU schema validation at '{error_path}': {e.message}",
                 location=error_path,
                 category="schema_validation"
             )
-        except Exception as e:
-            result.add_warning(
-                f"Schema loading error for {schema_file_name}: {e}",
-                category="schema_error"
-            )
+        if not errors:
+            result.add_info(f"MCU schema validation passed for {schema_file_name}", category="schema_validation")
         
         return result
     
@@ -776,22 +863,21 @@ class SchemaValidator:
             return result
         
         try:
-            with open(schema_file) as f:
-                schema = json.load(f)
-            
-            jsonschema.validate(device, schema)
-            result.add_info(f"Device schema validation passed for {device_type}", category="schema_validation")
-            
-        except jsonschema.ValidationError as e:
-            result.add_error(
-                f"Device schema validation ({device_type}): {e.message}",
-                category="schema_validation"
-            )
+            errors = self.mcu_database.get_validator(schema_file)(device)
         except Exception as e:
             result.add_warning(
                 f"Schema loading error for {device_type}: {e}",
                 category="schema_error"
             )
+            return result
+
+        for e in errors:
+            result.add_error(
+                f"Device schema validation ({device_type}): {e.message}",
+                category="schema_validation"
+            )
+        if not errors:
+            result.add_info(f"Device schema validation passed for {device_type}", category="schema_validation")
         
         return result
 
@@ -818,17 +904,31 @@ class ConfigValidator:
         """Run all validations and return combined result"""
         final_result = ValidationResult()
         
-        # Run all validators
-        validators = [
-            ("Schema-Based Pin Validation", self.pin_validator),
-            ("Schema-Based MCU Validation", self.mcu_validator), 
-            ("Peripheral Validation", self.peripheral_validator),
-            ("JSON Schema Validation", self.schema_validator)
-        ]
+        # Look the MCU up once and hand the specs to the schema-driven validators
+        mcu_specs = self.mcu_database.find_mcu_specs(config.board.mcu)
+        if mcu_specs:
+            validators = [
+                ("Schema-Based Pin Validation", partial(self.pin_validator.validate, mcu_specs=mcu_specs)),
+                ("Schema-Based MCU Validation", partial(self.mcu_validator.validate, mcu_specs=mcu_specs)),
+                ("Peripheral Validation", self.peripheral_validator.validate),
+                ("JSON Schema Validation", partial(self.schema_validator.validate, mcu_specs=mcu_specs))
+            ]
+        else:
+            # Without MCU specs only the checks that do not need them can run
+            final_result.add_error(
+                f"No schema found for MCU: {config.board.mcu}",
+                location="board.mcu",
+                category="schema_missing",
+                suggestion="Add appropriate schema file for this MCU"
+            )
+            validators = [
+                ("Peripheral Validation", self.peripheral_validator.validate),
+                ("JSON Schema Validation", self.schema_validator.validate_devices)
+            ]
         
-        for validator_name, validator in validators:
+        for validator_name, validate in validators:
             try:
-                result = validator.validate(config)
+                result = validate(config)
                 final_result.merge(result)
             except Exception as e:
                 final_result.add_error(
@@ -7,23 +7,66 @@ Author: Embedded Config System
 Description: Parses YAML configuration files for embedded peripheral setup
 """
 
-import json
+import hashlib
 import sys
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union, Tuple
-from dataclasses import dataclass, asdict, field
+from typing import Dict, List, Any, NamedTuple, Optional, Set, Union, Tuple, get_args, get_origin
+from dataclasses import MISSING, dataclass, field, fields, is_dataclass
+from functools import cached_property, lru_cache
 import yaml
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich import print as rprint
-import jsonschema
 
-# Console for rich output
-console = Console()
+from common import SLOTS, Loader, orjson, read_cached, store_cached
 
-@dataclass
+# rich and jsonschema are imported where used, library callers that only
+# load configs never pay for them
+@lru_cache(maxsize=None)
+def _console():
+    """Shared console for rich output, without highlighting or colour when stdout is not a TTY"""
+    from rich.console import Console
+    if not sys.stdout.isatty():
+        # Markup is still parsed so tags never leak into piped output
+        return Console(highlight=False, emoji=False, color_system=None)
+    return Console()
+
+# Set by main for --quiet, config warnings then go to stderr as plain text
+_quiet = False
+
+def _warn(message: str) -> None:
+    """Report a non-fatal configuration issue"""
+    if _quiet:
+        sys.stderr.write(f"Warning: {message}\n")
+    else:
+        _console().print(f"[yellow]Warning: {message}[/yellow]")
+
+@lru_cache(maxsize=256)
+def _schema_exists(path: Path) -> bool:
+    """Cached existence check for schema files, the schemas directory is fixed per run"""
+    return path.exists()
+
+@lru_cache(maxsize=64)
+def _load_schema(path_str: str) -> Optional[Tuple[Dict[str, Any], Any]]:
+    """Load a JSON schema and its checked validator once per process, None if the file is missing"""
+    path = Path(path_str)
+    if not _schema_exists(path):
+        return None
+    import json
+    import jsonschema
+
+    with open(path) as f:
+        schema = json.load(f)
+    # Pick the draft from $schema like jsonschema.validate does
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return schema, validator_cls(schema)
+
+def _first_error(validator: Any, instance: Any) -> Optional[Any]:
+    """Return the error jsonschema.validate would have raised, or None"""
+    import jsonschema
+
+    return jsonschema.exceptions.best_match(validator.iter_errors(instance))
+
+@dataclass(**SLOTS)
 class GPIOConfig:
     """GPIO pin configuration"""
     pin: str
@@ -33,23 +76,24 @@ class GPIOConfig:
     initial_state: str = "low"  # "low", "high"
     description: str = ""
     
+    _VALID_DIRECTIONS = ("input", "output")
+    _VALID_PULLS = ("none", "up", "down")
+    # Hyphenated literals are not interned by the compiler, parsed values are
+    _VALID_SPEEDS = tuple(map(sys.intern, ("low", "medium", "high", "very-high")))
+    _VALID_STATES = ("low", "high")
+
     def __post_init__(self):
         """Validate GPIO configuration after initialization"""
-        valid_directions = ["input", "output"]
-        valid_pulls = ["none", "up", "down"]
-        valid_speeds = ["low", "medium", "high", "very-high"]
-        valid_states = ["low", "high"]
-        
-        if self.direction not in valid_directions:
-            raise ValueError(f"Invalid direction '{self.direction}'. Must be one of: {valid_directions}")
-        if self.pull not in valid_pulls:
-            raise ValueError(f"Invalid pull '{self.pull}'. Must be one of: {valid_pulls}")
-        if self.speed not in valid_speeds:
-            raise ValueError(f"Invalid speed '{self.speed}'. Must be one of: {valid_speeds}")
-        if self.initial_state not in valid_states:
-            raise ValueError(f"Invalid initial_state '{self.initial_state}'. Must be one of: {valid_states}")
+        if self.direction not in self._VALID_DIRECTIONS:
+            raise ValueError(f"Invalid direction '{self.direction}'. Must be one of: {list(self._VALID_DIRECTIONS)}")
+        if self.pull not in self._VALID_PULLS:
+            raise ValueError(f"Invalid pull '{self.pull}'. Must be one of: {list(self._VALID_PULLS)}")
+        if self.speed not in self._VALID_SPEEDS:
+            raise ValueError(f"Invalid speed '{self.speed}'. Must be one of: {list(self._VALID_SPEEDS)}")
+        if self.initial_state not in self._VALID_STATES:
+            raise ValueError(f"Invalid initial_state '{self.initial_state}'. Must be one of: {list(self._VALID_STATES)}")
 
-@dataclass
+@dataclass(**SLOTS)
 class UARTConfig:
     """UART peripheral configuration"""
     name: str
@@ -63,26 +107,26 @@ class UARTConfig:
     rx_pin: str = ""
     description: str = ""
     
+    _VALID_BAUDRATES = (9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600)
+    _VALID_DATA_BITS = (7, 8, 9)
+    _VALID_STOP_BITS = (1, 2)
+    _VALID_PARITY = ("none", "even", "odd")
+    _VALID_FLOW_CONTROL = tuple(map(sys.intern, ("none", "rts-cts", "xon-xoff")))
+
     def __post_init__(self):
         """Validate UART configuration"""
-        valid_baudrates = [9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600]
-        valid_data_bits = [7, 8, 9]
-        valid_stop_bits = [1, 2]
-        valid_parity = ["none", "even", "odd"]
-        valid_flow_control = ["none", "rts-cts", "xon-xoff"]
-        
-        if self.baudrate not in valid_baudrates:
-            console.print(f"[yellow]Warning: Non-standard baudrate {self.baudrate}[/yellow]")
-        if self.data_bits not in valid_data_bits:
-            raise ValueError(f"Invalid data_bits '{self.data_bits}'. Must be one of: {valid_data_bits}")
-        if self.stop_bits not in valid_stop_bits:
-            raise ValueError(f"Invalid stop_bits '{self.stop_bits}'. Must be one of: {valid_stop_bits}")
-        if self.parity not in valid_parity:
-            raise ValueError(f"Invalid parity '{self.parity}'. Must be one of: {valid_parity}")
-        if self.flow_control not in valid_flow_control:
-            raise ValueError(f"Invalid flow_control '{self.flow_control}'. Must be one of: {valid_flow_control}")
+        if self.baudrate not in self._VALID_BAUDRATES:
+            _warn(f"Non-standard baudrate {self.baudrate}")
+        if self.data_bits not in self._VALID_DATA_BITS:
+            raise ValueError(f"Invalid data_bits '{self.data_bits}'. Must be one of: {list(self._VALID_DATA_BITS)}")
+        if self.stop_bits not in self._VALID_STOP_BITS:
+            raise ValueError(f"Invalid stop_bits '{self.stop_bits}'. Must be one of: {list(self._VALID_STOP_BITS)}")
+        if self.parity not in self._VALID_PARITY:
+            raise ValueError(f"Invalid parity '{self.parity}'. Must be one of: {list(self._VALID_PARITY)}")
+        if self.flow_control not in self._VALID_FLOW_CONTROL:
+            raise ValueError(f"Invalid flow_control '{self.flow_control}'. Must be one of: {list(self._VALID_FLOW_CONTROL)}")
 
-@dataclass
+@dataclass(**SLOTS)
 class I2CDevice:
     """I2C device configuration"""
     name: str
@@ -95,7 +139,7 @@ class I2CDevice:
         if not (8 <= self.address <= 119):  # 0x08 to 0x77 in decimal
             raise ValueError(f"Invalid I2C address {self.address}. Must be between 8 and 119 (0x08-0x77)")
 
-@dataclass
+@dataclass(**SLOTS)
 class I2CConfig:
     """I2C peripheral configuration"""
     name: str
@@ -107,13 +151,14 @@ class I2CConfig:
     description: str = ""
     devices: List[I2CDevice] = field(default_factory=list)
     
+    _VALID_SPEEDS = (100000, 400000, 1000000, 3400000)  # Standard, Fast, Fast+, High-speed
+
     def __post_init__(self):
         """Validate I2C configuration"""
-        valid_speeds = [100000, 400000, 1000000, 3400000]  # Standard, Fast, Fast+, High-speed
-        if self.speed not in valid_speeds:
-            console.print(f"[yellow]Warning: Non-standard I2C speed {self.speed} Hz[/yellow]")
+        if self.speed not in self._VALID_SPEEDS:
+            _warn(f"Non-standard I2C speed {self.speed} Hz")
 
-@dataclass
+@dataclass(**SLOTS)
 class TimerConfig:
     """Timer peripheral configuration"""
     name: str
@@ -127,11 +172,12 @@ class TimerConfig:
     output_pin: Optional[str] = None  # For PWM mode
     description: str = ""
     
+    _VALID_MODES = tuple(map(sys.intern, ("periodic", "pwm", "input-capture")))
+
     def __post_init__(self):
         """Validate timer configuration"""
-        valid_modes = ["periodic", "pwm", "input-capture"]
-        if self.mode not in valid_modes:
-            raise ValueError(f"Invalid mode '{self.mode}'. Must be one of: {valid_modes}")
+        if self.mode not in self._VALID_MODES:
+            raise ValueError(f"Invalid mode '{self.mode}'. Must be one of: {list(self._VALID_MODES)}")
         
         if self.mode == "pwm":
             if self.duty_cycle is None or not (0 <= self.duty_cycle <= 100):
@@ -139,7 +185,7 @@ class TimerConfig:
             if not self.output_pin:
                 raise ValueError("PWM mode requires output_pin")
 
-@dataclass
+@dataclass(**SLOTS)
 class SPIConfig:
     """SPI peripheral configuration"""
     name: str
@@ -154,20 +200,20 @@ class SPIConfig:
     cs_pins: List[str] = field(default_factory=list)
     description: str = ""
     
+    _VALID_MODES = (0, 1, 2, 3)
+    _VALID_DATA_BITS = (8, 16)
+    _VALID_BIT_ORDERS = ("msb", "lsb")
+
     def __post_init__(self):
         """Validate SPI configuration"""
-        valid_modes = [0, 1, 2, 3]
-        valid_data_bits = [8, 16]
-        valid_bit_orders = ["msb", "lsb"]
-        
-        if self.mode not in valid_modes:
-            raise ValueError(f"Invalid mode '{self.mode}'. Must be one of: {valid_modes}")
-        if self.data_bits not in valid_data_bits:
-            raise ValueError(f"Invalid data_bits '{self.data_bits}'. Must be one of: {valid_data_bits}")
-        if self.bit_order not in valid_bit_orders:
-            raise ValueError(f"Invalid bit_order '{self.bit_order}'. Must be one of: {valid_bit_orders}")
+        if self.mode not in self._VALID_MODES:
+            raise ValueError(f"Invalid mode '{self.mode}'. Must be one of: {list(self._VALID_MODES)}")
+        if self.data_bits not in self._VALID_DATA_BITS:
+            raise ValueError(f"Invalid data_bits '{self.data_bits}'. Must be one of: {list(self._VALID_DATA_BITS)}")
+        if self.bit_order not in self._VALID_BIT_ORDERS:
+            raise ValueError(f"Invalid bit_order '{self.bit_order}'. Must be one of: {list(self._VALID_BIT_ORDERS)}")
 
-@dataclass
+@dataclass(**SLOTS)
 class BoardConfig:
     """Board configuration"""
     name: str
@@ -185,7 +231,11 @@ class BoardConfig:
 
 @dataclass
 class EmbeddedConfig:
-    """Complete embedded system configuration"""
+    """Complete embedded system configuration
+
+    Not slotted: gpio_columns is a cached property, so the GPIO list must not
+    be mutated after it has been read.
+    """
     board: BoardConfig
     gpio: List[GPIOConfig] = field(default_factory=list)
     uart: Dict[str, UARTConfig] = field(default_factory=dict)
@@ -193,10 +243,208 @@ class EmbeddedConfig:
     timers: Dict[str, TimerConfig] = field(default_factory=dict)
     spi: Dict[str, SPIConfig] = field(default_factory=dict)
 
+    @cached_property
+    def gpio_columns(self) -> Tuple[Tuple[str, ...], ...]:
+        """GPIO summary columns (pins, directions, pulls, speeds, descriptions), built once"""
+        gpio = self.gpio
+        return (
+            tuple(g.pin for g in gpio),
+            tuple(g.direction for g in gpio),
+            tuple(g.pull for g in gpio),
+            tuple(g.speed for g in gpio),
+            tuple(g.description for g in gpio)
+        )
+
+class WalkResult(NamedTuple):
+    """Validation findings and pin usage gathered in one walk over a config"""
+    errors: List[str]
+    warnings: List[str]
+    used_pins: Set[str]
+
+
 class ConfigurationError(Exception):
     """Custom exception for configuration errors"""
     pass
 
+def _intern(value: Any) -> Any:
+    """Intern an enum string so the __post_init__ membership tests match by identity"""
+    return sys.intern(value) if type(value) is str else value
+
+def _compile_builder(cls: type, skip: Tuple[str, ...] = (), keys: Optional[Dict[str, str]] = None,
+                     interned: Tuple[str, ...] = (), **required: Any):
+    """Generate build(data, *skip) that constructs cls straight from a YAML mapping
+
+    The generated call has one data.get() per field, so parsing never loops
+    over field names. Fields in skip become parameters, keys maps fields to
+    differently named YAML keys, interned fields are passed through _intern,
+    and required fields need a parse default.
+    """
+    keys = keys or {}
+    namespace = {'cls': cls, '_intern': _intern}
+    args = []
+    for i, f in enumerate(fields(cls)):
+        if f.name in skip:
+            args.append(f"{f.name}={f.name}")
+            continue
+        key = keys.get(f.name, f.name)
+        if f.default_factory is not MISSING:
+            # Fresh mutable default per instance, as the dataclass would do
+            namespace[f"_factory{i}"] = f.default_factory
+            args.append(f"{f.name}=data[{key!r}] if {key!r} in data else _factory{i}()")
+            continue
+        namespace[f"_default{i}"] = f.default if f.default is not MISSING else required[f.name]
+        value = f"data.get({key!r}, _default{i})"
+        args.append(f"{f.name}=_intern({value})" if f.name in interned else f"{f.name}={value}")
+
+    source = f"def build({', '.join(('data',) + skip)}):\n    return cls({', '.join(args)})\n"
+    exec(compile(source, f"<build {cls.__name__}>", "exec"), namespace)
+    return namespace['build']
+
+# Peripheral names and nested device lists are passed in by the parser
+_build_board = _compile_builder(BoardConfig, name='', mcu='', clock_frequency=0)
+_build_gpio = _compile_builder(GPIOConfig, interned=('direction', 'pull', 'speed', 'initial_state'),
+                               pin='', direction='')
+_build_uart = _compile_builder(UARTConfig, ('name',), interned=('parity', 'flow_control'),
+                               enabled=False, baudrate=115200)
+_build_i2c_device = _compile_builder(I2CDevice, keys={'device_type': 'type'},  # YAML uses 'type'
+                                     name='', address=0, device_type='')
+_build_i2c = _compile_builder(I2CConfig, ('name', 'devices'), enabled=False, speed=100000,
+                              scl_pin='', sda_pin='')
+_build_timer = _compile_builder(TimerConfig, ('name',), interned=('mode',),
+                                enabled=False, prescaler=1, period=1000)
+_build_spi = _compile_builder(SPIConfig, ('name',), interned=('bit_order',),
+                              enabled=False, mode=0, speed=1000000)
+
+def _claim_pin(pin: str, used_pins: set) -> bool:
+    """Add pin to used_pins, False if it was already taken (hashes the pin once)"""
+    n = len(used_pins)
+    used_pins.add(pin)
+    return len(used_pins) != n
+
+def _field_values(obj: Any) -> Dict[str, Any]:
+    """Shallow field dict of a config dataclass; slotted instances have no __dict__"""
+    return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+
+def _schema_dict(config: EmbeddedConfig) -> Dict[str, Any]:
+    """Shallow dict view of a config for schema validation (device_type -> type)
+
+    Each object becomes one flat field dict, nested values are shared rather
+    than copied; I2C devices are spelled out because the schema expects 'type'.
+    """
+    return {
+        'board': _field_values(config.board),
+        'gpio': [_field_values(gpio) for gpio in config.gpio],
+        'uart': {name: _field_values(uart) for name, uart in config.uart.items()},
+        'i2c': {
+            name: {
+                **_field_values(i2c),
+                'devices': [
+                    {'name': d.name, 'address': d.address, 'description': d.description, 'type': d.device_type}
+                    for d in i2c.devices
+                ]
+            }
+            for name, i2c in config.i2c.items()
+        },
+        'timers': {name: _field_values(timer) for name, timer in config.timers.items()},
+        'spi': {name: _field_values(spi) for name, spi in config.spi.items()}
+    }
+
+def _json_leaf(value: Any, pad: str) -> str:
+    """Encode a non-dataclass value as json.dump(indent=2) would at the given indent"""
+    import json
+
+    if type(value) is str:
+        return json.encoder.encode_basestring_ascii(value)
+    if value is None:
+        return 'null'
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if type(value) is int:
+        return int.__repr__(value)
+    return json.dumps(value, indent=2, default=_json_default).replace('\n', '\n' + pad)
+
+def _json_key(key: Any) -> str:
+    """Encode a mapping key the way json coerces str, int, float, bool and None keys"""
+    return _json_leaf(key if type(key) is str else _json_leaf(key, ''), '')
+
+@lru_cache(maxsize=None)
+def _compile_dumper(cls: type):
+    """Generate dump(obj, w) that writes cls exactly as json.dump(obj, indent=2) would
+
+    The dataclass shape is unrolled into straight-line writes with loops only
+    for lists and dicts of dataclasses; every other field value is a leaf
+    encoded by _json_leaf. Built on first use since it needs json.
+    """
+    lines = []
+    pending = []
+    counter = iter(range(1 << 16))
+
+    def const(text: str) -> None:
+        pending.append(text)
+
+    def flush(ind: str) -> None:
+        if pending:
+            lines.append(f"{ind}w({''.join(pending)!r})")
+            pending.clear()
+
+    def code(ind: str, line: str) -> None:
+        flush(ind)
+        lines.append(ind + line)
+
+    def emit(expr: str, tp: Any, depth: int, ind: str) -> None:
+        pad, inner = '  ' * depth, '  ' * (depth + 1)
+        origin, args = get_origin(tp), get_args(tp)
+
+        if is_dataclass(tp):
+            const('{')
+            for i, f in enumerate(fields(tp)):
+                const(f'{"," if i else ""}\n{inner}"{f.name}": ')
+                emit(f"{expr}.{f.name}", f.type, depth + 1, ind)
+            const(f'\n{pad}}}')
+        elif origin in (list, dict) and is_dataclass(args[-1]):
+            n = next(counter)
+            opening, closing = ('[', ']') if origin is list else ('{', '}')
+            code(ind, f"if {expr}:")
+            code(ind + '    ', f"_s{n} = {opening + chr(10) + inner!r}")
+            if origin is list:
+                code(ind + '    ', f"for _x{n} in {expr}:")
+                code(ind + '        ', f"w(_s{n})")
+            else:
+                code(ind + '    ', f"for _k{n}, _x{n} in {expr}.items():")
+                code(ind + '        ', f"w(_s{n} + _json_key(_k{n}) + ': ')")
+            code(ind + '        ', f"_s{n} = {',' + chr(10) + inner!r}")
+            emit(f"_x{n}", args[-1], depth + 1, ind + '        ')
+            flush(ind + '        ')
+            code(ind + '    ', f"w({chr(10) + pad + closing!r})")
+            code(ind, "else:")
+            code(ind + '    ', f"w({opening + closing!r})")
+        else:
+            code(ind, f"w(_json_leaf({expr}, {pad!r}))")
+
+    emit('obj', cls, 0, '    ')
+    flush('    ')
+    source = "def dump(obj, w):\n" + "\n".join(lines) + "\n"
+    namespace = {'_json_leaf': _json_leaf, '_json_key': _json_key}
+    exec(compile(source, f"<dump {cls.__name__}>", "exec"), namespace)
+    return namespace['dump']
+
+def _json_default(obj: Any) -> Dict[str, Any]:
+    """json.dump and orjson hook that serializes config dataclasses without an asdict copy"""
+    if is_dataclass(obj):
+        return _field_values(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+# (part number prefix, schema family), checked in order
+_MCU_FAMILIES = (
+    ('stm32f4', 'stm32f4'),
+    ('stm32f1', 'stm32f1'),
+    ('stm32f0', 'stm32f0'),
+    ('atmega', 'atmega'),
+    ('esp32', 'esp32'),
+)
+
 class YAMLConfigParser:
     """YAML-based embedded peripheral configuration parser"""
     
@@ -204,13 +452,33 @@ class YAMLConfigParser:
         self.config: Optional[EmbeddedConfig] = None
         self.validation_errors: List[str] = []
         self.validation_warnings: List[str] = []
+        self.used_pins: Set[str] = set()
+        # Config the validation lists above belong to, None until validated
+        self._validated_config: Optional[EmbeddedConfig] = None
     
-    def load_config(self, config_file: Union[str, Path]) -> EmbeddedConfig:
-        """Load and parse YAML configuration file"""
+    def load_config(self, config_file: Union[str, Path], use_cache: bool = False) -> EmbeddedConfig:
+        """Load and parse YAML configuration file
+
+        With use_cache the parsed YAML data is kept in common.CACHE_DIR under a hash
+        of the file's bytes, so an unchanged file skips YAML parsing. The
+        dataclasses are still built, and validated, on every load.
+        """
         try:
-            with open(config_file, 'r', encoding='utf-8') as file:
-                data = yaml.safe_load(file)
-                return self._parse_config_data(data)
+            # Bytes go straight to libyaml, which detects the encoding itself
+            with open(config_file, 'rb') as file:
+                key = data = None
+                if use_cache:
+                    key = hashlib.sha256(file.read()).hexdigest()
+                    data = read_cached(key)
+                    # Rewind and let yaml read the file object, its error marks then name the file
+                    file.seek(0)
+                if data is None:
+                    data = yaml.load(file, Loader=Loader)
+                    if key is not None:
+                        store_cached(key, data)
+            return self._parse_config_data(data)
+        except ConfigurationError:
+            raise
         except FileNotFoundError:
             raise ConfigurationError(f"Configuration file not found: {config_file}")
         except yaml.YAMLError as e:
@@ -219,132 +487,86 @@ class YAMLConfigParser:
             raise ConfigurationError(f"Error loading configuration: {e}")
     
     def _parse_config_data(self, data: Dict[str, Any]) -> EmbeddedConfig:
-        """Parse configuration data into structured objects"""
+        """Parse configuration data into structured objects
+
+        Dataclass validation errors are reported with the config location
+        they came from; anything else propagates to load_config.
+        """
+        # Parse board configuration
+        if 'board' not in data:
+            raise ConfigurationError("Board configuration is required")
+
         try:
-            # Parse board configuration
-            if 'board' not in data:
-                raise ConfigurationError("Board configuration is required")
-            
-            board_data = data['board']
-            board = BoardConfig(
-                name=board_data.get('name', ''),
-                mcu=board_data.get('mcu', ''),
-                clock_frequency=board_data.get('clock_frequency', 0),
-                voltage=board_data.get('voltage', 3.3),
-                description=board_data.get('description', '')
-            )
-            
-            # Parse GPIO configurations
-            gpio_configs = []
-            for gpio_data in data.get('gpio', []):
-                gpio = GPIOConfig(
-                    pin=gpio_data.get('pin', ''),
-                    direction=gpio_data.get('direction', ''),
-                    pull=gpio_data.get('pull', 'none'),
-                    speed=gpio_data.get('speed', 'medium'),
-                    initial_state=gpio_data.get('initial_state', 'low'),
-                    description=gpio_data.get('description', '')
-                )
-                gpio_configs.append(gpio)
-            
-            # Parse UART configurations
-            uart_configs = {}
-            for uart_name, uart_data in data.get('uart', {}).items():
-                uart = UARTConfig(
-                    name=uart_name,
-                    enabled=uart_data.get('enabled', False),
-                    baudrate=uart_data.get('baudrate', 115200),
-                    data_bits=uart_data.get('data_bits', 8),
-                    stop_bits=uart_data.get('stop_bits', 1),
-                    parity=uart_data.get('parity', 'none'),
-                    flow_control=uart_data.get('flow_control', 'none'),
-                    tx_pin=uart_data.get('tx_pin', ''),
-                    rx_pin=uart_data.get('rx_pin', ''),
-                    description=uart_data.get('description', '')
-                )
-                uart_configs[uart_name] = uart
-            
-            # Parse I2C configurations
-            i2c_configs = {}
-            for i2c_name, i2c_data in data.get('i2c', {}).items():
-                # Parse devices
-                devices = []
-                for device_data in i2c_data.get('devices', []):
-                    device = I2CDevice(
-                        name=device_data.get('name', ''),
-                        address=device_data.get('address', 0),
-                        device_type=device_data.get('type', ''),  # YAML uses 'type', class uses 'device_type'
-                        description=device_data.get('description', '')
-                    )
-                    devices.append(device)
-                
-                i2c = I2CConfig(
-                    name=i2c_name,
-                    enabled=i2c_data.get('enabled', False),
-                    speed=i2c_data.get('speed', 100000),
-                    scl_pin=i2c_data.get('scl_pin', ''),
-                    sda_pin=i2c_data.get('sda_pin', ''),
-                    pull_up=i2c_data.get('pull_up', True),
-                    description=i2c_data.get('description', ''),
-                    devices=devices
-                )
-                i2c_configs[i2c_name] = i2c
-            
-            # Parse Timer configurations
-            timer_configs = {}
-            for timer_name, timer_data in data.get('timers', {}).items():
-                timer = TimerConfig(
-                    name=timer_name,
-                    enabled=timer_data.get('enabled', False),
-                    prescaler=timer_data.get('prescaler', 1),
-                    period=timer_data.get('period', 1000),
-                    mode=timer_data.get('mode', 'periodic'),
-                    auto_reload=timer_data.get('auto_reload', True),
-                    channel=timer_data.get('channel'),
-                    duty_cycle=timer_data.get('duty_cycle'),
-                    output_pin=timer_data.get('output_pin'),
-                    description=timer_data.get('description', '')
-                )
-                timer_configs[timer_name] = timer
-            
-            # Parse SPI configurations
-            spi_configs = {}
-            for spi_name, spi_data in data.get('spi', {}).items():
-                spi = SPIConfig(
-                    name=spi_name,
-                    enabled=spi_data.get('enabled', False),
-                    mode=spi_data.get('mode', 0),
-                    speed=spi_data.get('speed', 1000000),
-                    data_bits=spi_data.get('data_bits', 8),
-                    bit_order=spi_data.get('bit_order', 'msb'),
-                    sck_pin=spi_data.get('sck_pin', ''),
-                    miso_pin=spi_data.get('miso_pin', ''),
-                    mosi_pin=spi_data.get('mosi_pin', ''),
-                    cs_pins=spi_data.get('cs_pins', []),
-                    description=spi_data.get('description', '')
-                )
-                spi_configs[spi_name] = spi
-            
-            # Create final configuration
-            self.config = EmbeddedConfig(
-                board=board,
-                gpio=gpio_configs,
-                uart=uart_configs,
-                i2c=i2c_configs,
-                timers=timer_configs,
-                spi=spi_configs
-            )
-            
-            return self.config
+            board = _build_board(data['board'])
+        except ValueError as e:
+            raise ConfigurationError(f"Error parsing board: {e}") from e
+
+        # Parse GPIO configurations
+        gpio_configs = []
+        for i, gpio_data in enumerate(data.get('gpio', [])):
+            try:
+                gpio_configs.append(_build_gpio(gpio_data))
+            except ValueError as e:
+                raise ConfigurationError(f"Error parsing gpio[{i}]: {e}") from e
+
+        # Parse UART configurations
+        uart_configs = {}
+        for uart_name, uart_data in data.get('uart', {}).items():
+            try:
+                uart_configs[uart_name] = _build_uart(uart_data, uart_name)
+            except ValueError as e:
+                raise ConfigurationError(f"Error parsing uart.{uart_name}: {e}") from e
+
+        # Parse I2C configurations
+        i2c_configs = {}
+        for i2c_name, i2c_data in data.get('i2c', {}).items():
+            # Parse devices
+            devices = []
+            for j, device_data in enumerate(i2c_data.get('devices', [])):
+                try:
+                    devices.append(_build_i2c_device(device_data))
+                except ValueError as e:
+                    raise ConfigurationError(f"Error parsing i2c.{i2c_name}.devices[{j}]: {e}") from e
             
-        except Exception as e:
-            raise ConfigurationError(f"Error parsing configuration data: {e}")
+            try:
+                i2c_configs[i2c_name] = _build_i2c(i2c_data, i2c_name, devices)
+            except ValueError as e:
+                raise ConfigurationError(f"Error parsing i2c.{i2c_name}: {e}") from e
+
+        # Parse Timer configurations
+        timer_configs = {}
+        for timer_name, timer_data in data.get('timers', {}).items():
+            try:
+                timer_configs[timer_name] = _build_timer(timer_data, timer_name)
+            except ValueError as e:
+                raise ConfigurationError(f"Error parsing timers.{timer_name}: {e}") from e
+
+        # Parse SPI configurations
+        spi_configs = {}
+        for spi_name, spi_data in data.get('spi', {}).items():
+            try:
+                spi_configs[spi_name] = _build_spi(spi_data, spi_name)
+            except ValueError as e:
+                raise ConfigurationError(f"Error parsing spi.{spi_name}: {e}") from e
+
+        # Create final configuration
+        self.config = EmbeddedConfig(
+            board=board,
+            gpio=gpio_configs,
+            uart=uart_configs,
+            i2c=i2c_configs,
+            timers=timer_configs,
+            spi=spi_configs
+        )
+
+        return self.config
     
     def validate_pin_format(self, pin: str) -> bool:
         """Validate pin format (e.g., PA0, PB15)"""
-        import re
-        pattern = r'^P[A-Z]\d{1,2}$'
-        return bool(re.match(pattern, pin))
+        n = len(pin)
+        if n < 3 or n > 4 or pin[0] != 'P':
+            return False
+        return 'A' <= pin[1] <= 'Z' and pin[2:].isdecimal()
     
     def validate_with_schemas(self, config_data: Dict[str, Any]) -> List[str]:
         """Validate configuration using JSON schemas"""
@@ -353,6 +575,12 @@ class YAMLConfigParser:
         # Get MCU type
         mcu_type = config_data.get('board', {}).get('mcu', '').lower()
         
+        # Nothing to check without an MCU schema on disk or any enabled I2C devices
+        if not (mcu_type and _schema_exists(self._mcu_schema_file(mcu_type))) and not any(
+                i2c.get('enabled', False) and i2c.get('devices')
+                for i2c in config_data.get('i2c', {}).values()):
+            return errors
+
         # MCU-specific validation
         if mcu_type:
             mcu_errors = self._validate_mcu_schema(config_data, mcu_type)
@@ -364,24 +592,29 @@ class YAMLConfigParser:
         
         return errors
     
-    def _validate_mcu_schema(self, config_data: Dict[str, Any], mcu_type: str) -> List[str]:
-        """Validate against MCU-specific schema"""
+    def _mcu_schema_file(self, mcu_type: str) -> Path:
+        """Schema path for an MCU, falling back to its family's schema"""
         schema_file = Path("schemas/mcu") / f"{mcu_type}.json"
         
-        if not schema_file.exists():
+        if not _schema_exists(schema_file):
             # Try to match by family (e.g., stm32f407vgt6 -> stm32f4)
             family_name = self._extract_mcu_family(mcu_type)
             schema_file = Path("schemas/mcu") / f"{family_name}.json"
         
-        if schema_file.exists():
+        return schema_file
+
+    def _validate_mcu_schema(self, config_data: Dict[str, Any], mcu_type: str) -> List[str]:
+        """Validate against MCU-specific schema"""
+        schema_file = self._mcu_schema_file(mcu_type)
+
+        if _schema_exists(schema_file):
             try:
-                with open(schema_file) as f:
-                    schema = json.load(f)
+                _, validator = _load_schema(str(schema_file))
                 
-                jsonschema.validate(config_data, schema)
-                return []
+                e = _first_error(validator, config_data)
+                if e is None:
+                    return []
                 
-            except jsonschema.ValidationError as e:
                 # More detailed error reporting
                 error_path = " -> ".join(str(p) for p in e.absolute_path) if e.absolute_path else "root"
                 return [f"MCU validation ({mcu_type}) at '{error_path}': {e.message}"]
@@ -410,15 +643,14 @@ class YAMLConfigParser:
         """Validate device against peripheral schema"""
         schema_file = Path("schemas/peripherals") / f"{device_type}.json"
         
-        if schema_file.exists():
+        if _schema_exists(schema_file):
             try:
-                with open(schema_file) as f:
-                    schema = json.load(f)
+                _, validator = _load_schema(str(schema_file))
                 
-                jsonschema.validate(device, schema)
-                return []
+                e = _first_error(validator, device)
+                if e is None:
+                    return []
                 
-            except jsonschema.ValidationError as e:
                 return [f"Peripheral validation ({device_type}): {e.message}"]
             except Exception as e:
                 return [f"Schema loading error for {device_type}: {e}"]
@@ -433,125 +665,112 @@ class YAMLConfigParser:
         
         mcu_lower = mcu_type.lower()
         
-        if mcu_lower.startswith('stm32f4'):
-            return 'stm32f4'
-        elif mcu_lower.startswith('stm32f1'):
-            return 'stm32f1'
-        elif mcu_lower.startswith('stm32f0'):
-            return 'stm32f0'
-        elif mcu_lower.startswith('atmega'):
-            return 'atmega'
-        elif mcu_lower.startswith('esp32'):
-            return 'esp32'
+        for prefix, family in _MCU_FAMILIES:
+            if mcu_lower.startswith(prefix):
+                return family
         
         return mcu_lower  # Return as-is if no family match
     
     def validate_configuration(self) -> Tuple[List[str], List[str]]:
-        """Validate the complete configuration"""
+        """Validate the complete configuration, once per loaded config"""
+        errors, warnings, _ = self.walk()
+        return errors, warnings
+
+    def walk(self, validate: bool = True) -> WalkResult:
+        """Validate the configuration and collect its used pins in a single pass
+
+        With validate=False only the pins are collected, the schema and pin
+        checks are skipped and nothing is memoized.
+        """
         if not self.config:
-            return ["No configuration loaded"], []
+            return WalkResult(["No configuration loaded"], [], set())
+        if self._validated_config is self.config:
+            return WalkResult(self.validation_errors, self.validation_warnings, self.used_pins)
         
         errors = []
         warnings = []
         
         # First: JSON Schema validation
         # Transform config for schema validation (device_type -> type)
-        config_dict = asdict(self.config)
+        if validate:
+            config_dict = _schema_dict(self.config)
+
+            schema_errors = self.validate_with_schemas(config_dict)
+            errors.extend(schema_errors)
         
-        # Transform I2C devices for schema validation
-        for i2c_name, i2c_config in config_dict.get('i2c', {}).items():
-            for device in i2c_config.get('devices', []):
-                if 'device_type' in device:
-                    device['type'] = device.pop('device_type')  # Rename device_type to type for schema
+        # Second: Custom Python validation
+        used_pins = set()   # every pin in use, for the usage summary
+        claimed = set()     # well-formed pins claimed so far, for conflicts
+
+        # Format and conflict checks for every claimed pin in one pass
+        for pin, label, usage in self._iter_pin_claims():
+            if pin:
+                used_pins.add(pin)
+            if not validate:
+                continue
+            if not self.validate_pin_format(pin):
+                errors.append(f"Invalid {label}: {pin}")
+            elif not _claim_pin(pin, claimed):
+                errors.append(f"Pin conflict: {pin} {usage}")
         
-        schema_errors = self.validate_with_schemas(config_dict)
-        errors.extend(schema_errors)
+        # Timers drive their output pin in every mode, only PWM ones are checked
+        for timer in self.config.timers.values():
+            if timer.enabled and timer.output_pin and timer.mode != "pwm":
+                used_pins.add(timer.output_pin)
         
-        # Second: Custom Python validation
-        used_pins = set()
+        if not validate:
+            return WalkResult(errors, warnings, used_pins)
+
+        # Check clock frequency sanity
+        clock_freq = self.config.board.clock_frequency
+        if clock_freq > 200_000_000:  # 200 MHz - reasonable upper limit for MCUs
+            warnings.append(f"Very high clock frequency: {clock_freq:,} Hz")
+        elif clock_freq < 1_000_000:  # 1 MHz - reasonable lower limit
+            warnings.append(f"Very low clock frequency: {clock_freq:,} Hz")
+
+        self.validation_errors = errors
+        self.validation_warnings = warnings
+        self.used_pins = used_pins
+        self._validated_config = self.config
         
-        # Validate GPIO pins
+        return WalkResult(errors, warnings, used_pins)
+
+    def _iter_pin_claims(self):
+        """Yield (pin, error label, conflict usage) in GPIO, UART, I2C, SPI, timer order
+
+        Disabled peripherals, non-PWM timers and unset optional pins are left
+        out; I2C bus pins are required, so an empty one is reported as invalid.
+        """
         for gpio in self.config.gpio:
-            if not self.validate_pin_format(gpio.pin):
-                errors.append(f"Invalid GPIO pin format: {gpio.pin}")
-            elif gpio.pin in used_pins:
-                errors.append(f"Pin conflict: {gpio.pin} used multiple times")
-            else:
-                used_pins.add(gpio.pin)
+            yield gpio.pin, "GPIO pin format", "used multiple times"
         
-        # Validate UART pins
         for uart_name, uart in self.config.uart.items():
             if uart.enabled:
                 if uart.tx_pin:
-                    if not self.validate_pin_format(uart.tx_pin):
-                        errors.append(f"Invalid UART {uart_name} TX pin: {uart.tx_pin}")
-                    elif uart.tx_pin in used_pins:
-                        errors.append(f"Pin conflict: {uart.tx_pin} used by both GPIO and UART {uart_name}")
-                    else:
-                        used_pins.add(uart.tx_pin)
-                
+                    yield uart.tx_pin, f"UART {uart_name} TX pin", f"used by both GPIO and UART {uart_name}"
                 if uart.rx_pin:
-                    if not self.validate_pin_format(uart.rx_pin):
-                        errors.append(f"Invalid UART {uart_name} RX pin: {uart.rx_pin}")
-                    elif uart.rx_pin in used_pins:
-                        errors.append(f"Pin conflict: {uart.rx_pin} used by both GPIO and UART {uart_name}")
-                    else:
-                        used_pins.add(uart.rx_pin)
-        
-        # Validate I2C pins
+                    yield uart.rx_pin, f"UART {uart_name} RX pin", f"used by both GPIO and UART {uart_name}"
+
         for i2c_name, i2c in self.config.i2c.items():
             if i2c.enabled:
-                if not self.validate_pin_format(i2c.scl_pin):
-                    errors.append(f"Invalid I2C {i2c_name} SCL pin: {i2c.scl_pin}")
-                elif i2c.scl_pin in used_pins:
-                    errors.append(f"Pin conflict: {i2c.scl_pin} used by I2C {i2c_name} SCL")
-                else:
-                    used_pins.add(i2c.scl_pin)
-                
-                if not self.validate_pin_format(i2c.sda_pin):
-                    errors.append(f"Invalid I2C {i2c_name} SDA pin: {i2c.sda_pin}")
-                elif i2c.sda_pin in used_pins:
-                    errors.append(f"Pin conflict: {i2c.sda_pin} used by I2C {i2c_name} SDA")
-                else:
-                    used_pins.add(i2c.sda_pin)
-        
-        # Validate SPI pins
+                yield i2c.scl_pin, f"I2C {i2c_name} SCL pin", f"used by I2C {i2c_name} SCL"
+                yield i2c.sda_pin, f"I2C {i2c_name} SDA pin", f"used by I2C {i2c_name} SDA"
+
         for spi_name, spi in self.config.spi.items():
             if spi.enabled:
-                spi_pins = [spi.sck_pin, spi.miso_pin, spi.mosi_pin] + spi.cs_pins
-                for pin in spi_pins:
+                for pin in [spi.sck_pin, spi.miso_pin, spi.mosi_pin] + spi.cs_pins:
                     if pin:
-                        if not self.validate_pin_format(pin):
-                            errors.append(f"Invalid SPI {spi_name} pin: {pin}")
-                        elif pin in used_pins:
-                            errors.append(f"Pin conflict: {pin} used by SPI {spi_name}")
-                        else:
-                            used_pins.add(pin)
-        
-        # Validate timer PWM pins
+                        yield pin, f"SPI {spi_name} pin", f"used by SPI {spi_name}"
+
         for timer_name, timer in self.config.timers.items():
             if timer.enabled and timer.mode == "pwm" and timer.output_pin:
-                if not self.validate_pin_format(timer.output_pin):
-                    errors.append(f"Invalid Timer {timer_name} PWM pin: {timer.output_pin}")
-                elif timer.output_pin in used_pins:
-                    errors.append(f"Pin conflict: {timer.output_pin} used by Timer {timer_name} PWM")
-                else:
-                    used_pins.add(timer.output_pin)
-        
-        # Check clock frequency sanity
-        clock_freq = self.config.board.clock_frequency
-        if clock_freq > 200_000_000:  # 200 MHz - reasonable upper limit for MCUs
-            warnings.append(f"Very high clock frequency: {clock_freq:,} Hz")
-        elif clock_freq < 1_000_000:  # 1 MHz - reasonable lower limit
-            warnings.append(f"Very low clock frequency: {clock_freq:,} Hz")
-        
-        self.validation_errors = errors
-        self.validation_warnings = warnings
-        
-        return errors, warnings
+                yield timer.output_pin, f"Timer {timer_name} PWM pin", f"used by Timer {timer_name} PWM"
     
     def generate_summary_report(self) -> None:
         """Generate a comprehensive summary report"""
+        from rich.table import Table
+
+        console = _console()
         if not self.config:
             console.print("[red]No configuration loaded[/red]")
             return
@@ -579,124 +798,136 @@ class YAMLConfigParser:
             gpio_table.add_column("Speed", style="magenta")
             gpio_table.add_column("Description", style="yellow")
             
-            for gpio in self.config.gpio:
-                gpio_table.add_row(
-                    gpio.pin,
-                    gpio.direction,
-                    gpio.pull,
-                    gpio.speed,
-                    gpio.description
-                )
+            for row in zip(*self.config.gpio_columns):
+                gpio_table.add_row(*row)
             console.print(gpio_table)
         
         # UART summary
-        enabled_uart = [(name, uart) for name, uart in self.config.uart.items() if uart.enabled]
-        if enabled_uart:
-            uart_table = Table(title=f"📡 UART Configuration ({len(enabled_uart)} enabled)")
-            uart_table.add_column("Interface", style="cyan")
-            uart_table.add_column("Baudrate", style="green")
-            uart_table.add_column("TX Pin", style="blue")
-            uart_table.add_column("RX Pin", style="blue")
-            uart_table.add_column("Description", style="yellow")
-            
-            for name, uart in enabled_uart:
-                uart_table.add_row(
-                    name,
-                    f"{uart.baudrate:,}",
-                    uart.tx_pin,
-                    uart.rx_pin,
-                    uart.description
-                )
+        uart_table = Table()
+        uart_table.add_column("Interface", style="cyan")
+        uart_table.add_column("Baudrate", style="green")
+        uart_table.add_column("TX Pin", style="blue")
+        uart_table.add_column("RX Pin", style="blue")
+        uart_table.add_column("Description", style="yellow")
+
+        for name, uart in self.config.uart.items():
+            if not uart.enabled:
+                continue
+            uart_table.add_row(
+                name,
+                f"{uart.baudrate:,}",
+                uart.tx_pin,
+                uart.rx_pin,
+                uart.description
+            )
+
+        if uart_table.row_count:
+            uart_table.title = f"📡 UART Configuration ({uart_table.row_count} enabled)"
             console.print(uart_table)
         
         # I2C summary
-        enabled_i2c = [(name, i2c) for name, i2c in self.config.i2c.items() if i2c.enabled]
-        if enabled_i2c:
-            i2c_table = Table(title=f"🔗 I2C Configuration ({len(enabled_i2c)} buses)")
-            i2c_table.add_column("Bus", style="cyan")
-            i2c_table.add_column("Speed", style="green")
-            i2c_table.add_column("SCL Pin", style="blue")
-            i2c_table.add_column("SDA Pin", style="blue")
-            i2c_table.add_column("Devices", style="magenta")
-            i2c_table.add_column("Description", style="yellow")
+        i2c_table = Table()
+        i2c_table.add_column("Bus", style="cyan")
+        i2c_table.add_column("Speed", style="green")
+        i2c_table.add_column("SCL Pin", style="blue")
+        i2c_table.add_column("SDA Pin", style="blue")
+        i2c_table.add_column("Devices", style="magenta")
+        i2c_table.add_column("Description", style="yellow")
+
+        for name, i2c in self.config.i2c.items():
+            if not i2c.enabled:
+                continue
+            device_count = len(i2c.devices)
+            device_list = ", ".join([f"{d.name}@0x{d.address:02X}" for d in i2c.devices[:2]])
+            if device_count > 2:
+                device_list += f" (+{device_count-2} more)"
             
-            for name, i2c in enabled_i2c:
-                device_count = len(i2c.devices)
-                device_list = ", ".join([f"{d.name}@0x{d.address:02X}" for d in i2c.devices[:2]])
-                if device_count > 2:
-                    device_list += f" (+{device_count-2} more)"
-                
-                i2c_table.add_row(
-                    name,
-                    f"{i2c.speed:,} Hz",
-                    i2c.scl_pin,
-                    i2c.sda_pin,
-                    device_list,
-                    i2c.description
-                )
+            i2c_table.add_row(
+                name,
+                f"{i2c.speed:,} Hz",
+                i2c.scl_pin,
+                i2c.sda_pin,
+                device_list,
+                i2c.description
+            )
+
+        if i2c_table.row_count:
+            i2c_table.title = f"🔗 I2C Configuration ({i2c_table.row_count} buses)"
             console.print(i2c_table)
         
         # Timer summary
-        enabled_timers = [(name, timer) for name, timer in self.config.timers.items() if timer.enabled]
-        if enabled_timers:
-            timer_table = Table(title=f"⏱️  Timer Configuration ({len(enabled_timers)} enabled)")
-            timer_table.add_column("Timer", style="cyan")
-            timer_table.add_column("Mode", style="green")
-            timer_table.add_column("Prescaler", style="blue")
-            timer_table.add_column("Period", style="magenta")
-            timer_table.add_column("Output", style="yellow")
+        timer_table = Table()
+        timer_table.add_column("Timer", style="cyan")
+        timer_table.add_column("Mode", style="green")
+        timer_table.add_column("Prescaler", style="blue")
+        timer_table.add_column("Period", style="magenta")
+        timer_table.add_column("Output", style="yellow")
+
+        for name, timer in self.config.timers.items():
+            if not timer.enabled:
+                continue
+            output_info = ""
+            if timer.mode == "pwm" and timer.output_pin:
+                output_info = f"{timer.output_pin} ({timer.duty_cycle}%)"
             
-            for name, timer in enabled_timers:
-                output_info = ""
-                if timer.mode == "pwm" and timer.output_pin:
-                    output_info = f"{timer.output_pin} ({timer.duty_cycle}%)"
-                
-                timer_table.add_row(
-                    name,
-                    timer.mode,
-                    str(timer.prescaler),
-                    str(timer.period),
-                    output_info
-                )
+            timer_table.add_row(
+                name,
+                timer.mode,
+                str(timer.prescaler),
+                str(timer.period),
+                output_info
+            )
+
+        if timer_table.row_count:
+            timer_table.title = f"⏱️  Timer Configuration ({timer_table.row_count} enabled)"
             console.print(timer_table)
         
         # SPI summary
-        enabled_spi = [(name, spi) for name, spi in self.config.spi.items() if spi.enabled]
-        if enabled_spi:
-            spi_table = Table(title=f"🔄 SPI Configuration ({len(enabled_spi)} enabled)")
-            spi_table.add_column("Interface", style="cyan")
-            spi_table.add_column("Mode", style="green")
-            spi_table.add_column("Speed", style="blue")
-            spi_table.add_column("Pins", style="magenta")
-            spi_table.add_column("Description", style="yellow")
+        spi_table = Table()
+        spi_table.add_column("Interface", style="cyan")
+        spi_table.add_column("Mode", style="green")
+        spi_table.add_column("Speed", style="blue")
+        spi_table.add_column("Pins", style="magenta")
+        spi_table.add_column("Description", style="yellow")
+
+        for name, spi in self.config.spi.items():
+            if not spi.enabled:
+                continue
+            pins_info = f"SCK:{spi.sck_pin} MISO:{spi.miso_pin} MOSI:{spi.mosi_pin}"
+            if spi.cs_pins:
+                pins_info += f" CS:{','.join(spi.cs_pins)}"
             
-            for name, spi in enabled_spi:
-                pins_info = f"SCK:{spi.sck_pin} MISO:{spi.miso_pin} MOSI:{spi.mosi_pin}"
-                if spi.cs_pins:
-                    pins_info += f" CS:{','.join(spi.cs_pins)}"
-                
-                spi_table.add_row(
-                    name,
-                    f"Mode {spi.mode}",
-                    f"{spi.speed:,} Hz",
-                    pins_info,
-                    spi.description
-                )
+            spi_table.add_row(
+                name,
+                f"Mode {spi.mode}",
+                f"{spi.speed:,} Hz",
+                pins_info,
+                spi.description
+            )
+
+        if spi_table.row_count:
+            spi_table.title = f"🔄 SPI Configuration ({spi_table.row_count} enabled)"
             console.print(spi_table)
     
-    def export_to_json(self, output_file: Union[str, Path]) -> None:
-        """Export configuration to JSON file"""
+    def export_to_json(self, output_file: Union[str, Path], quiet: bool = False) -> None:
+        """Export configuration to JSON file, quiet skips the confirmation message"""
         if not self.config:
             raise ConfigurationError("No configuration loaded")
         
-        # Convert to dictionary
-        config_dict = asdict(self.config)
-        
-        # Save to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(config_dict, f, indent=2, ensure_ascii=False)
+        # Save to file, dataclasses are converted as the encoder reaches them
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+            data = orjson.dumps(self.config, default=_json_default, option=option)
+            with open(output_file, 'wb') as f:
+                f.write(data)
+        else:
+            import json
+
+            with open(output_file, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                json.dump(self.config, f, indent=2, ensure_ascii=False, default=_json_default)
         
-        console.print(f"[green]Configuration exported to: {output_file}[/green]")
+        if not quiet:
+            _console().print(f"[green]Configuration exported to: {output_file}[/green]")
 
 
 @click.command()
@@ -705,31 +936,52 @@ class YAMLConfigParser:
 @click.option('--validate', '-v', is_flag=True, help='Validate configuration')
 @click.option('--summary', '-s', is_flag=True, help='Show configuration summary')
 @click.option('--verbose', is_flag=True, help='Verbose output')
-def main(config_file: str, output: str, validate: bool, summary: bool, verbose: bool):
+@click.option('--no-cache', is_flag=True, help='Ignore cached parse results')
+@click.option('--quiet', '-q', is_flag=True, help='Machine-readable mode, no banner or status messages')
+def main(config_file: str, output: str, validate: bool, summary: bool, verbose: bool, no_cache: bool, quiet: bool):
     """
     Parse YAML configuration file for embedded peripheral setup.
     
     CONFIG_FILE: Path to the YAML configuration file
     """
-    console.print(Panel.fit(
-        "[bold blue]Embedded Peripheral Configuration Parser[/bold blue]\n"
-        "[dim]Clean YAML-based configuration parser for embedded peripherals[/dim]",
-        border_style="blue"
-    ))
+    global _quiet
+    _quiet = quiet
     
-    console.print(f"\n[yellow]📁 Loading configuration:[/yellow] [cyan]{config_file}[/cyan]")
+    # In quiet mode rich is only touched if a summary is asked for
+    if not quiet:
+        from rich.panel import Panel
+
+        console = _console()
+        console.print(Panel.fit(
+            "[bold blue]Embedded Peripheral Configuration Parser[/bold blue]\n"
+            "[dim]Clean YAML-based configuration parser for embedded peripherals[/dim]",
+            border_style="blue"
+        ))
+
+        console.print(f"\n[yellow]📁 Loading configuration:[/yellow] [cyan]{config_file}[/cyan]")
     
     try:
         parser = YAMLConfigParser()
         
         # Load and parse configuration
-        config = parser.load_config(config_file)
-        console.print("[green]✓ Configuration loaded successfully[/green]")
+        config = parser.load_config(config_file, use_cache=not no_cache)
+        if not quiet:
+            console.print("[green]✓ Configuration loaded successfully[/green]")
+
+        # Validation and pin usage come out of the same walk over the config
+        if validate or verbose:
+            result = parser.walk(validate=validate)
         
         # Validation
-        if validate:
+        if validate and quiet:
+            # Diagnostics go to stderr as plain lines, stdout stays clean for the JSON
+            sys.stderr.writelines(f"{error}\n" for error in result.errors)
+            sys.stderr.writelines(f"Warning: {warning}\n" for warning in result.warnings)
+            if result.errors:
+                sys.exit(1)
+        elif validate:
             console.print("\n[yellow]🔍 Validating configuration...[/yellow]")
-            errors, warnings = parser.validate_configuration()
+            errors, warnings = result.errors, result.warnings
             
             if errors:
                 console.print("\n[red]❌ Validation Errors:[/red]")
@@ -749,65 +1001,80 @@ def main(config_file: str, output: str, validate: bool, summary: bool, verbose:
             else:
                 console.print("[green]✓ All validation checks passed[/green]")
         
-        # Summary report
+        # Summary and pin usage are output in their own right, quiet or not
         if summary or verbose:
+            from rich.text import Text
+
+            console = _console()
             console.print("\n" + "="*60)
             parser.generate_summary_report()
             console.print("="*60)
         
         # Pin usage summary
         if verbose:
-            used_pins = set()
-            # Collect all used pins
-            for gpio in config.gpio:
-                used_pins.add(gpio.pin)
-            for uart in config.uart.values():
-                if uart.enabled and uart.tx_pin:
-                    used_pins.add(uart.tx_pin)
-                if uart.enabled and uart.rx_pin:
-                    used_pins.add(uart.rx_pin)
-            for i2c in config.i2c.values():
-                if i2c.enabled:
-                    used_pins.add(i2c.scl_pin)
-                    used_pins.add(i2c.sda_pin)
-            for timer in config.timers.values():
-                if timer.enabled and timer.output_pin:
-                    used_pins.add(timer.output_pin)
-            for spi in config.spi.values():
-                if spi.enabled:
-                    used_pins.update([spi.sck_pin, spi.miso_pin, spi.mosi_pin] + spi.cs_pins)
-            
-            # Remove empty pins
-            used_pins = {pin for pin in used_pins if pin}
+            used_pins = result.used_pins
             
             console.print(f"\n[bold cyan]📌 Pin Usage Summary:[/bold cyan]")
             console.print(f"Total pins used: [yellow]{len(used_pins)}[/yellow]")
             if used_pins:
-                sorted_pins = sorted(used_pins)
-                console.print(f"Pins: [cyan]{', '.join(sorted_pins)}[/cyan]")
+                # Styled span instead of markup, the joined pins are not re-parsed
+                console.print(Text.assemble("Pins: ", (", ".join(sorted(used_pins)), "cyan")))
         
         # Export to JSON
         if output:
-            parser.export_to_json(output)
+            parser.export_to_json(output, quiet=quiet)
         
         # Default JSON output if no other output specified
         if not summary and not verbose and not output:
-            config_dict = asdict(config)
-            print(json.dumps(config_dict, indent=2))
+            # Indent only for a terminal, pipes get compact JSON
+            pretty = sys.stdout.isatty()
+            data = None
+            if orjson is not None:
+                option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+                if pretty:
+                    option |= orjson.OPT_INDENT_2
+                try:
+                    data = orjson.dumps(config, default=_json_default, option=option)
+                except orjson.JSONEncodeError:
+                    pass
+
+            # Non-ASCII text takes the json path below, which escapes it for any terminal encoding
+            if data is not None and data.isascii():
+                # Flush first, rich writes through the text layer
+                sys.stdout.flush()
+                sys.stdout.buffer.write(data + b"\n")
+            elif pretty:
+                # Generated for the config shape, same text as json.dump(indent=2)
+                _compile_dumper(EmbeddedConfig)(config, sys.stdout.write)
+                sys.stdout.write("\n")
+            else:
+                import json
+
+                json.dump(config, sys.stdout, separators=(',', ':'), default=_json_default)
+                sys.stdout.write("\n")
         
-        console.print("\n[green]🎉 Processing completed successfully![/green]")
+        if not quiet:
+            console.print("\n[green]🎉 Processing completed successfully![/green]")
         
     except ConfigurationError as e:
-        console.print(f"\n[red]❌ Configuration Error:[/red] {e}")
+        if quiet:
+            sys.stderr.write(f"Configuration Error: {e}\n")
+        else:
+            _console().print(f"\n[red]❌ Configuration Error:[/red] {e}")
         if verbose:
             import traceback
-            console.print(f"\n[red]Traceback:[/red]\n{traceback.format_exc()}")
+            sys.stderr.write("\nTraceback:\n")
+            traceback.print_exc(file=sys.stderr)
         sys.exit(1)
     except Exception as e:
-        console.print(f"\n[red]❌ Unexpected Error:[/red] {e}")
+        if quiet:
+            sys.stderr.write(f"Unexpected Error: {e}\n")
+        else:
+            _console().print(f"\n[red]❌ Unexpected Error:[/red] {e}")
         if verbose:
             import traceback
-            console.print(f"\n[red]Traceback:[/red]\n{traceback.format_exc()}")
+            sys.stderr.write("\nTraceback:\n")
+            traceback.print_exc(file=sys.stderr)
         sys.exit(1)
 
 